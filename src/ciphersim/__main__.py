@@ -0,0 +1,5 @@
+"""Allow running CipherSim with `python -m ciphersim`"""
+
+from .cli import main
+
+main()
@@ -5,25 +5,90 @@ Main entry point for the CipherSim educational cybersecurity tool.
 """
 
 import sys
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional
+
 import click
-from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
 
 from . import ETHICAL_WARNING, __version__
-from .core.hash_engine import HashEngine, HashAlgorithm
-from .core.attack_simulator import AttackSimulator, AttackMode, AttackConfig, GPUSimulator
-from .core.defense_simulator import DefenseSimulator, DefenseType
-from .modules.password_analyzer import PasswordAnalyzer
-from .modules.learning import SecurityEducation, show_learning_menu
 
+if TYPE_CHECKING:
+    from rich.console import Console, Group
 
-console = Console()
 
+# Heavy modules (rich, hashing backends, simulators) are imported inside the
+# commands that need them so `--help` and one-shot commands stay fast.
 
-def show_banner() -> None:
-    """Display CipherSim banner and ethical warning"""
-    banner = f"""
+# Command option choices; each name is the value of the matching enum member
+_HASH_ALGORITHMS = ('argon2id', 'scrypt', 'pbkdf2_sha256', 'bcrypt')
+_ATTACK_ALGORITHMS = ('argon2id', 'bcrypt', 'pbkdf2_sha256')
+_ATTACK_MODES = ('dictionary', 'brute_force', 'hybrid', 'mask')
+_DEFENSES = (
+    'rate_limiting', 'account_lockout', 'progressive_delay',
+    'ip_throttling', 'honeytoken', 'mfa',
+)
+
+_HASH_CHOICE = click.Choice(_HASH_ALGORITHMS)
+_ATTACK_ALGORITHM_CHOICE = click.Choice(_ATTACK_ALGORITHMS)
+_MODE_CHOICE = click.Choice(_ATTACK_MODES)
+_DEFENSE_CHOICE = click.Choice(_DEFENSES)
+
+# GPU comparison table columns: (header, style, HashAlgorithm value)
+_GPU_TABLE_COLS = (
+    ("Argon2id", "green", "argon2id"),
+    ("scrypt", "yellow", "scrypt"),
+    ("PBKDF2-SHA256", "orange1", "pbkdf2_sha256"),
+    ("bcrypt", "magenta", "bcrypt"),
+)
+
+# Static interactive menu text
+_MAIN_MENU = (
+    "\n[bold cyan]Main Menu[/bold cyan]\n\n"
+    "  1. Analyze Password\n"
+    "  2. Hash Password\n"
+    "  3. Simulate Attack\n"
+    "  4. Demonstrate Defense\n"
+    "  5. Learn Security Concepts\n"
+    "  6. GPU Performance Comparison\n"
+    "  7. Exit\n"
+)
+_ATTACK_MENU = (
+    "\n[yellow]Attack simulation options:[/yellow]\n"
+    "  1. Dictionary Attack\n"
+    "  2. Brute Force Attack\n"
+    "  3. Hybrid Attack"
+)
+_DEFENSE_MENU = (
+    "\n[yellow]Defense mechanisms:[/yellow]\n"
+    "  1. Rate Limiting\n"
+    "  2. Account Lockout\n"
+    "  3. Progressive Delay\n"
+    "  4. IP Throttling\n"
+    "  5. Honeytoken\n"
+    "  6. MFA"
+)
+
+# Interactive menu choices
+_MENU_ATTACK_MODES = MappingProxyType({'1': 'dictionary', '2': 'brute_force', '3': 'hybrid'})
+_MENU_DEFENSES = MappingProxyType({
+    '1': 'rate_limiting',
+    '2': 'account_lockout',
+    '3': 'progressive_delay',
+    '4': 'ip_throttling',
+    '5': 'honeytoken',
+    '6': 'mfa',
+})
+
+
+@functools.cache
+def get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use"""
+    from rich.console import Console
+    return Console()
+
+
+_BANNER = f"""
 [bold cyan]
  ██████╗██╗██████╗ ██╗  ██╗███████╗██████╗ ███████╗██╗███╗   ███╗
 ██╔════╝██║██╔══██╗██║  ██║██╔════╝██╔══██╗██╔════╝██║████╗ ████║
@@ -35,12 +100,33 @@ def show_banner() -> None:
 [yellow]Educational Password Security Simulation Tool v{__version__}[/yellow]
 [dim]For authorized security training and education only[/dim]
 """
-    console.print(banner)
-    console.print(ETHICAL_WARNING)
+
+
+@functools.cache
+def _banner_renderable() -> "Group":
+    """Parse the banner and ethical warning markup once"""
+    from rich.console import Group
+
+    console = get_console()
+    return Group(console.render_str(_BANNER), console.render_str(ETHICAL_WARNING))
+
+
+@functools.cache
+def _render_static(markup: str) -> str:
+    """Render fixed markup to terminal output once"""
+    console = get_console()
+    with console.capture() as capture:
+        console.print(markup)
+    return capture.get()
+
+
+def show_banner() -> None:
+    """Display CipherSim banner and ethical warning"""
+    get_console().print(_banner_renderable())
 
 
 @click.group()
-@click.version_option(version=__version__)
+@click.version_option(__version__, '--version', '-V', prog_name='ciphersim')
 def cli() -> None:
     """
     CipherSim - Educational Password Security Simulation Tool
@@ -73,17 +159,38 @@ def analyze(password: str, verbose: bool) -> None:
     
     This tool will show you:
       • Password strength score (0-100)
-      • How long it would take to crack
       • Security problems found
+    
+    With --verbose you also get:
+      • How long it would take to crack
       • How to make it stronger
     """
+    _do_analyze(password, verbose)
+
+
+def _do_analyze(password: str, verbose: bool) -> None:
+    """Analyze a password and display the report"""
+    from .modules.password_analyzer import PasswordAnalyzer
+
     analyzer = PasswordAnalyzer()
-    analyzer.analyze(password, verbose=True)
+    analysis = analyzer.analyze(password, verbose=verbose)
+    
+    if not verbose:
+        console = get_console()
+        console.print(
+            f"\n[bold]Strength:[/bold] {analysis.strength.value.upper().replace('_', ' ')} "
+            f"({analysis.score}/100, {analysis.entropy_bits:.2f} bits of entropy)"
+        )
+        for pattern in analysis.patterns:
+            console.print(f"  • {pattern.pattern_type}: {pattern.description}")
+        console.print(
+            "\n[dim]Use --verbose for crack time estimates and recommendations[/dim]\n"
+        )
 
 
 @cli.command()
 @click.argument('password', metavar='PASSWORD')
-@click.option('--algorithm', '-a', type=click.Choice(['argon2id', 'scrypt', 'pbkdf2_sha256', 'bcrypt']), 
+@click.option('--algorithm', '-a', type=_HASH_CHOICE,
               default='argon2id', help='Hashing algorithm (default: argon2id)')
 def hash(password: str, algorithm: str) -> None:
     """
@@ -108,36 +215,46 @@ def hash(password: str, algorithm: str) -> None:
     
     The hash output is what gets stored in databases, never the password itself!
     """
+    _do_hash(password, algorithm)
+
+
+def _do_hash(password: str, algorithm: str) -> None:
+    """Hash a password and display the result"""
+    from rich.text import Text
+    from .core.hash_engine import HashEngine, HashAlgorithm
+
+    console = get_console()
     console.print(f"\n[cyan]Hashing password with {algorithm}...[/cyan]\n")
     
     engine = HashEngine()
-    algo_map = {
-        'argon2id': HashAlgorithm.ARGON2ID,
-        'scrypt': HashAlgorithm.SCRYPT,
-        'pbkdf2_sha256': HashAlgorithm.PBKDF2_SHA256,
-        'bcrypt': HashAlgorithm.BCRYPT,
-    }
-    
-    result = engine.hash_password(password, algo_map[algorithm])
-    
-    console.print(f"[green]Algorithm:[/green] {result.algorithm.value}")
-    console.print(f"[green]Hash:[/green] {result.hash_value}")
-    if result.salt:
-        console.print(f"[green]Salt:[/green] {result.salt}")
-    console.print(f"[green]Time:[/green] {result.time_ms:.2f}ms")
-    console.print(f"[green]Parameters:[/green] {result.parameters}\n")
+    result = engine.hash_password(password, HashAlgorithm(algorithm))
+    
+    # Assemble the whole block so it is highlighted and written in one print
+    salt_line = (("Salt:", "green"), f" {result.salt}\n") if result.salt else ()
+    output = Text.assemble(
+        ("Algorithm:", "green"), f" {result.algorithm.value}\n",
+        ("Hash:", "green"), f" {result.hash_value}\n",
+        *salt_line,
+        ("Time:", "green"), f" {result.time_ns / 1e6:.2f}ms\n",
+        ("Parameters:", "green"), f" {result.parameters}\n",
+    )
+    console.print(console.highlighter(output))
 
 
 @cli.command()
-@click.option('--mode', '-m', type=click.Choice(['dictionary', 'brute_force', 'hybrid', 'mask']),
+@click.option('--mode', '-m', type=_MODE_CHOICE,
               default='dictionary', help='Type of attack to simulate')
 @click.option('--target', '-t', required=True, metavar='PASSWORD',
               help='The password to test (this is what we try to "crack")')
-@click.option('--algorithm', '-a', type=click.Choice(['argon2id', 'bcrypt', 'pbkdf2_sha256']),
+@click.option('--algorithm', '-a', type=_ATTACK_ALGORITHM_CHOICE,
               default='argon2id', help='Hashing algorithm used')
 @click.option('--max-attempts', default=100000, help='Stop after this many tries')
 @click.option('--mask', help='Pattern for mask attack (e.g., ?u?l?l?l?d?d?d)')
-def simulate(mode: str, target: str, algorithm: str, max_attempts: int, mask: str) -> None:
+@click.option('--workers', default=1, type=click.IntRange(min=1),
+              help='Processes used to scan brute-force and mask keyspaces')
+def simulate(
+    mode: str, target: str, algorithm: str, max_attempts: int, mask: str, workers: int
+) -> None:
     """
     Simulate a password attack to see how long it takes to crack. (SAFE - OFFLINE ONLY)
     
@@ -159,6 +276,7 @@ def simulate(mode: str, target: str, algorithm: str, max_attempts: int, mask: st
       --max-attempts  Stop after this many tries (default: 100,000)
       --mask          Pattern for mask mode (e.g., "?u?l?l?l?d?d?d")
                       ?u=uppercase, ?l=lowercase, ?d=digit
+      --workers       Processes for brute_force/mask scans (default: 1)
     
     Examples:
     
@@ -180,52 +298,61 @@ def simulate(mode: str, target: str, algorithm: str, max_attempts: int, mask: st
       • Whether your password was found
       • Why certain passwords are weak
     """
+    _do_simulate(mode, target, algorithm, max_attempts, mask, workers)
+
+
+def _do_simulate(
+    mode: str,
+    target: str,
+    algorithm: str,
+    max_attempts: int,
+    mask: Optional[str],
+    workers: int = 1
+) -> None:
+    """Run an attack simulation and display the results"""
+    from rich.text import Text
+    from .core.hash_engine import HashAlgorithm
+    from .core.attack_simulator import AttackSimulator, AttackMode, AttackConfig
+
+    console = get_console()
     console.print("\n[bold red]⚠️  SIMULATION MODE - Educational purposes only[/bold red]\n")
     
-    mode_map = {
-        'dictionary': AttackMode.DICTIONARY,
-        'brute_force': AttackMode.BRUTE_FORCE,
-        'hybrid': AttackMode.HYBRID,
-        'mask': AttackMode.MASK,
-    }
-    
-    algo_map = {
-        'argon2id': HashAlgorithm.ARGON2ID,
-        'bcrypt': HashAlgorithm.BCRYPT,
-        'pbkdf2_sha256': HashAlgorithm.PBKDF2_SHA256,
-    }
-    
     config = AttackConfig(
-        mode=mode_map[mode],
+        mode=AttackMode(mode),
         target_hash="simulated_hash",
-        algorithm=algo_map[algorithm],
+        algorithm=HashAlgorithm(algorithm),
         max_attempts=max_attempts,
-        mask=mask
+        mask=mask,
+        workers=workers
     )
     
     simulator = AttackSimulator()
     result = simulator.simulate_attack(config, target)
     
-    # Display results
-    console.print("\n[bold cyan]📊 Simulation Results[/bold cyan]\n")
+    # Display results as a single assembled block
+    parts: list = ["\n", ("📊 Simulation Results", "bold cyan"), "\n\n"]
     
     if result.success:
-        console.print(f"[green]✓ Password found:[/green] {result.password_found}")
+        parts += [("✓ Password found:", "green"), f" {result.password_found}\n"]
     else:
-        console.print(f"[red]✗ Password not found[/red]")
+        parts += [("✗ Password not found", "red"), "\n"]
     
-    console.print(f"[yellow]Attempts:[/yellow] {result.attempts:,}")
-    console.print(f"[yellow]Time:[/yellow] {result.time_seconds:.2f} seconds")
-    console.print(f"[yellow]Rate:[/yellow] {result.attempts/result.time_seconds:.0f} attempts/second")
+    # Runs too short for the clock to measure (e.g. a first-try hit) would divide by zero
+    rate = result.attempts / result.time_seconds if result.time_seconds > 1e-9 else float('inf')
+    parts += [
+        ("Attempts:", "yellow"), f" {result.attempts:,}\n",
+        ("Time:", "yellow"), f" {result.time_seconds:.2f} seconds\n",
+        ("Rate:", "yellow"), f" {format(rate, '.0f')} attempts/second\n",
+    ]
     
     if result.stopped_by_limit:
-        console.print(f"\n[yellow]⚠️  Stopped by attempt limit ({max_attempts:,})[/yellow]")
-    console.print()
+        parts += ["\n", (f"⚠️  Stopped by attempt limit ({max_attempts:,})", "yellow"), "\n"]
+    
+    console.print(console.highlighter(Text.assemble(*parts)))
 
 
 @cli.command()
-@click.option('--defense', '-d', type=click.Choice(['rate_limiting', 'account_lockout', 
-              'progressive_delay', 'ip_throttling', 'honeytoken', 'mfa']),
+@click.option('--defense', '-d', type=_DEFENSE_CHOICE,
               default='rate_limiting', help='Type of defense to demonstrate')
 @click.option('--attempts', default=100, help='Number of attacks to simulate')
 def defend(defense: str, attempts: int) -> None:
@@ -261,17 +388,15 @@ def defend(defense: str, attempts: int) -> None:
       • Why the defense works
       • Real-world effectiveness
     """
-    defense_map = {
-        'rate_limiting': DefenseType.RATE_LIMITING,
-        'account_lockout': DefenseType.ACCOUNT_LOCKOUT,
-        'progressive_delay': DefenseType.PROGRESSIVE_DELAY,
-        'ip_throttling': DefenseType.IP_THROTTLING,
-        'honeytoken': DefenseType.HONEYTOKEN,
-        'mfa': DefenseType.MFA,
-    }
-    
-    simulator = DefenseSimulator()
-    simulator.simulate_defense(defense_map[defense], attack_attempts=attempts)
+    _do_defend(defense, attempts)
+
+
+def _do_defend(defense: str, attempts: int) -> None:
+    """Run a defense demonstration"""
+    from .core.defense_simulator import DefenseSimulator, DefenseType
+
+    with DefenseSimulator() as simulator:
+        simulator.simulate_defense(DefenseType(defense), attack_attempts=attempts)
 
 
 @cli.command()
@@ -310,13 +435,20 @@ def learn(topic: str) -> None:
       • Developers building secure apps
       • Anyone who wants to understand password security
     """
+    _do_learn(topic)
+
+
+def _do_learn(topic: Optional[str]) -> None:
+    """Teach a topic, or show the topic menu"""
+    from .modules.learning import SecurityEducation, show_learning_menu
+
     educator = SecurityEducation()
     
     if topic:
         educator.teach_topic(topic)
     else:
         show_learning_menu()
-        console.print("\n[dim]Usage: ciphersim learn <topic>[/dim]\n")
+        get_console().print("\n[dim]Usage: ciphersim learn <topic>[/dim]\n")
 
 
 @cli.command()
@@ -337,26 +469,33 @@ def gpu() -> None:
     
     And how many passwords/second each can try for different algorithms.
     """
+    _do_gpu()
+
+
+def _do_gpu() -> None:
+    """Display the GPU performance comparison table"""
+    from rich.table import Table
+    from .core.hash_engine import HashAlgorithm
+    from .core.attack_simulator import GPUSimulator
+
+    console = get_console()
     console.print("\n[bold cyan]🖥️  GPU Performance Comparison[/bold cyan]\n")
     
     comparison = GPUSimulator.get_performance_comparison()
     
-    from rich.table import Table
     table = Table(title="Simulated Hash/Second Performance")
     table.add_column("GPU Tier", style="cyan")
-    table.add_column("Argon2id", style="green")
-    table.add_column("scrypt", style="yellow")
-    table.add_column("PBKDF2-SHA256", style="orange1")
-    table.add_column("bcrypt", style="magenta")
-    
-    for tier, perf in comparison.items():
-        table.add_row(
-            tier.replace('_', ' '),
-            f"{perf.get(HashAlgorithm.ARGON2ID, 0):,}",
-            f"{perf.get(HashAlgorithm.SCRYPT, 0):,}",
-            f"{perf.get(HashAlgorithm.PBKDF2_SHA256, 0):,}",
-            f"{perf.get(HashAlgorithm.BCRYPT, 0):,}",
-        )
+    for header, style, _ in _GPU_TABLE_COLS:
+        table.add_column(header, style=style)
+    
+    # Resolve the enum members once rather than per table cell
+    algorithms = tuple(HashAlgorithm(value) for _, _, value in _GPU_TABLE_COLS)
+    rows = [
+        (tier.replace('_', ' '), *(f"{perf.get(algo, 0):,}" for algo in algorithms))
+        for tier, perf in comparison.items()
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     console.print("\n[green]💡 Notice how Argon2id is much slower on GPU (memory-hard)[/green]")
@@ -385,70 +524,51 @@ def interactive() -> None:
     
     Recommended if you're just starting out or want to explore features!
     """
+    from .modules.password_analyzer import PasswordAnalyzer
+    from .modules.learning import SecurityEducation, show_learning_menu
+
+    console = get_console()
     show_banner()
     
+    analyzer = PasswordAnalyzer()
+    educator = SecurityEducation()
+    
     while True:
-        console.print("\n[bold cyan]Main Menu[/bold cyan]\n")
-        console.print("  1. Analyze Password")
-        console.print("  2. Hash Password")
-        console.print("  3. Simulate Attack")
-        console.print("  4. Demonstrate Defense")
-        console.print("  5. Learn Security Concepts")
-        console.print("  6. GPU Performance Comparison")
-        console.print("  7. Exit\n")
+        console.file.write(_render_static(_MAIN_MENU))
         
         choice = console.input("[cyan]Select option (1-7):[/cyan] ")
         
         if choice == '1':
             password = console.input("\n[yellow]Enter password to analyze:[/yellow] ")
-            analyzer = PasswordAnalyzer()
             analyzer.analyze(password, verbose=True)
         
         elif choice == '2':
             password = console.input("\n[yellow]Enter password to hash:[/yellow] ")
             algo = console.input("[yellow]Algorithm (argon2id/bcrypt/scrypt):[/yellow] ") or 'argon2id'
-            ctx = click.Context(hash)
-            ctx.invoke(hash, password=password, algorithm=algo)
+            _do_hash(password, algo)
         
         elif choice == '3':
-            console.print("\n[yellow]Attack simulation options:[/yellow]")
-            console.print("  1. Dictionary Attack")
-            console.print("  2. Brute Force Attack")
-            console.print("  3. Hybrid Attack")
+            console.file.write(_render_static(_ATTACK_MENU))
             mode_choice = console.input("[cyan]Select mode (1-3):[/cyan] ")
-            mode_map = {'1': 'dictionary', '2': 'brute_force', '3': 'hybrid'}
-            mode = mode_map.get(mode_choice, 'dictionary')
+            mode = _MENU_ATTACK_MODES.get(mode_choice, 'dictionary')
             
             target = console.input("[yellow]Target password:[/yellow] ")
-            ctx = click.Context(simulate)
-            ctx.invoke(simulate, mode=mode, target=target, algorithm='argon2id', 
-                      max_attempts=100000, mask=None)
+            _do_simulate(mode, target, 'argon2id', max_attempts=100000, mask=None)
         
         elif choice == '4':
-            console.print("\n[yellow]Defense mechanisms:[/yellow]")
-            console.print("  1. Rate Limiting")
-            console.print("  2. Account Lockout")
-            console.print("  3. Progressive Delay")
-            console.print("  4. IP Throttling")
-            console.print("  5. Honeytoken")
-            console.print("  6. MFA")
+            console.file.write(_render_static(_DEFENSE_MENU))
             def_choice = console.input("[cyan]Select defense (1-6):[/cyan] ")
-            def_map = {'1': 'rate_limiting', '2': 'account_lockout', '3': 'progressive_delay',
-                      '4': 'ip_throttling', '5': 'honeytoken', '6': 'mfa'}
-            defense = def_map.get(def_choice, 'rate_limiting')
+            defense = _MENU_DEFENSES.get(def_choice, 'rate_limiting')
             
-            ctx = click.Context(defend)
-            ctx.invoke(defend, defense=defense, attempts=100)
+            _do_defend(defense, attempts=100)
         
         elif choice == '5':
             show_learning_menu()
             topic = console.input("\n[cyan]Enter topic name:[/cyan] ")
-            educator = SecurityEducation()
             educator.teach_topic(topic)
         
         elif choice == '6':
-            ctx = click.Context(gpu)
-            ctx.invoke(gpu)
+            _do_gpu()
         
         elif choice == '7':
             console.print("\n[green]Thank you for using CipherSim! Stay secure! 🔐[/green]\n")
@@ -460,10 +580,15 @@ def interactive() -> None:
 
 def main() -> None:
     """Main entry point"""
+    # Answer version queries without building the Click command tree
+    if sys.argv[1:] in (['--version'], ['-V']):
+        click.echo(f"ciphersim, version {__version__}")
+        return
+    
     # Show banner if no arguments provided
     if len(sys.argv) == 1:
         show_banner()
-        console.print("\n[yellow]Use 'ciphersim --help' for command list or 'ciphersim interactive' for menu mode[/yellow]\n")
+        get_console().print("\n[yellow]Use 'ciphersim --help' for command list or 'ciphersim interactive' for menu mode[/yellow]\n")
     
     cli()
 
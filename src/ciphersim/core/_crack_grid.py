@@ -0,0 +1,23 @@
+"""
+Numba kernel for HashEngine.estimate_crack_time_batch
+
+Only imported when the optional 'jit' extra (numba) is installed; the engine
+falls back to plain NumPy otherwise. Compiled code is cached in __pycache__
+so the compile cost is paid once per install.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def log2_crack_grid(lengths: np.ndarray, charset_sizes: np.ndarray, log2_hps: float) -> np.ndarray:
+    """log2 of the average-case crack time for every (charset size, length) pair"""
+    out = np.empty((charset_sizes.size, lengths.size))
+    for i in prange(charset_sizes.size):
+        log2_charset = math.log2(charset_sizes[i]) if charset_sizes[i] > 1 else 0.0
+        for j in range(lengths.size):
+            out[i, j] = lengths[j] * log2_charset - 1 - log2_hps
+    return out
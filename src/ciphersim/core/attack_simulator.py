@@ -5,19 +5,373 @@ WARNING: This module is for EDUCATIONAL PURPOSES ONLY.
 All simulations are performed offline with no network activity.
 """
 
-from typing import Iterator, Optional, List, Tuple, Dict
+from typing import Any, AnyStr, Callable, Iterator, Optional, List, Sequence, Tuple, Dict, Union
 from enum import Enum
 from dataclasses import dataclass
+import functools
+import hashlib
 import itertools
+import math
+import multiprocessing
+import mmap
+import os
 import string
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+import numpy as np
+from rich.progress import (
+    Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TaskID
+)
 
 from .hash_engine import HashEngine, HashAlgorithm
 
 
+# Candidates tested per iteration of the simulation loop
+BATCH_SIZE = 1024
+
+# Row width of packed candidate batches: passwords up to this many bytes are
+# stored and compared as a single uint64
+PACKED_WIDTH = 8
+
+# Brute-force character set used when AttackConfig.charset is not given
+DEFAULT_CHARSET = string.ascii_lowercase + string.digits
+
+# Common passwords tried by dictionary attacks without a wordlist file
+DEFAULT_WORDLIST = (
+    b"password", b"123456", b"12345678", b"qwerty", b"abc123",
+    b"password123", b"admin", b"letmein", b"welcome", b"monkey",
+    b"dragon", b"master", b"sunshine", b"princess", b"football",
+    b"iloveyou", b"shadow", b"michael", b"superman", b"trustno1",
+)
+
+# DEMO credential pairs for credential stuffing - NOT REAL
+DEMO_CREDENTIALS = (
+    ("user1@example.com", b"Password123!"),
+    ("testuser@demo.com", b"Welcome2024"),
+    ("admin@test.local", b"Admin@123"),
+    ("demo@email.com", b"Summer2024!"),
+)
+
+# Hybrid attack mutations: l33t substitutions (either case) and appended suffixes
+LEET_TABLE = bytes.maketrans(b'aeiostAEIOST', b'431057431057')
+HYBRID_SUFFIXES = (b'1', b'123', b'2024', b'2025', b'!')
+
+# Text equivalents for wordlist entries that are not plain ASCII
+LEET_TEXT_TABLE = str.maketrans('aeiostAEIOST', '431057431057')
+HYBRID_TEXT_SUFFIXES = tuple(suffix.decode('ascii') for suffix in HYBRID_SUFFIXES)
+
+# Character sets for mask placeholders (?l, ?u, ?d, ?s, ?a)
+MASK_SPECIAL_CHARS = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+MASK_CHARSETS = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': MASK_SPECIAL_CHARS,
+    'a': string.ascii_letters + string.digits + string.punctuation,
+}
+
+# Receives each batch of candidates (ndarray of fixed-width bytes or a list
+# of bytes); returns True to stop the scan
+Visitor = Callable[[Union[np.ndarray, List[bytes]]], bool]
+
+# Argon2id memory cost (KiB) of HashEngine's default "owasp" preset
+_DEFAULT_ARGON2_MEMORY = HashEngine.ARGON2_PRESETS["owasp"]["memory_cost"]
+
+# Digest used when the attack verifies candidates against config.target_hash.
+# Only unsalted SHA-256 is modelled; the slow salted algorithms are not.
+VERIFY_ALGORITHM = 'sha256'
+VERIFY_DIGEST_SIZE = hashlib.new(VERIFY_ALGORITHM).digest_size
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_mask(mask: str) -> Tuple[str, ...]:
+    """Parse a mask pattern into one character set per position"""
+    charsets = []
+    i = 0
+    
+    while i < len(mask):
+        if mask[i] == '?' and i + 1 < len(mask):
+            # Unknown placeholders are skipped
+            placeholder = MASK_CHARSETS.get(mask[i+1])
+            if placeholder is not None:
+                charsets.append(placeholder)
+            i += 2
+        else:
+            # Literal character
+            charsets.append(mask[i])
+            i += 1
+    
+    return tuple(charsets)
+
+
+def _enumerate_columns(charsets: Sequence[str]) -> Iterator[bytes]:
+    """
+    Enumerate the product of per-column charsets, last column fastest.
+    
+    A mixed-radix counter keeps one encoded piece per column and only
+    rewrites the columns that carry, so no tuple is built per candidate.
+    """
+    columns = [[c.encode('utf-8') for c in charset] for charset in charsets]
+    if not all(columns):
+        return
+    
+    digits = [0] * len(columns)
+    parts = [column[0] for column in columns]
+    while True:
+        yield b''.join(parts)
+        
+        position = len(columns) - 1
+        while position >= 0:
+            digits[position] += 1
+            if digits[position] < len(columns[position]):
+                parts[position] = columns[position][digits[position]]
+                break
+            digits[position] = 0
+            parts[position] = columns[position][0]
+            position -= 1
+        else:
+            return
+
+
+def _fill_block(charsets_flat: np.ndarray, offsets: np.ndarray, lengths: np.ndarray,
+                out: np.ndarray, start: int, count: int,
+                shape: Optional[Tuple[int, ...]] = None) -> None:
+    """
+    Write rows start..start+count of a mixed-radix enumeration into out.
+    
+    Column j draws from charsets_flat[offsets[j]:offsets[j] + lengths[j]];
+    the last column varies fastest, matching itertools.product. Passing the
+    keyspace shape (only valid when its size fits in np.intp) decodes all
+    digits in one np.unravel_index call instead of a divmod per column.
+    """
+    index = np.arange(start, start + count, dtype=np.int64)
+    if shape is not None:
+        for column, digit in enumerate(np.unravel_index(index, shape)):
+            out[:count, column] = charsets_flat[offsets[column] + digit]
+        return
+    
+    for column in range(len(lengths) - 1, -1, -1):
+        index, digit = np.divmod(index, lengths[column])
+        out[:count, column] = charsets_flat[offsets[column] + digit]
+
+
+def _hybrid_mutations(
+    word: AnyStr,
+    suffixes: Tuple[AnyStr, ...],
+    leet_table: Any
+) -> Iterator[AnyStr]:
+    """Yield a wordlist entry followed by its case, suffix and l33t mutations"""
+    capitalized = word.capitalize()
+    yield word
+    
+    # Common mutations
+    yield capitalized
+    yield word.upper()
+    yield word.lower()
+    
+    # Append common numbers
+    for suffix in suffixes:
+        yield word + suffix
+        yield capitalized + suffix
+    
+    # L33t speak substitutions
+    leet_word = word.translate(leet_table)
+    if leet_word != word:
+        yield leet_word
+
+
+def _scan_columns(
+    charsets: Sequence[str],
+    visit: Visitor,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> bool:
+    """
+    Push the product of per-column ASCII charsets to visit in batches of bytes.
+    
+    start and stop select a slice of the enumeration (default: all of it).
+    Each batch is a view of a reused buffer, valid only during the call.
+    
+    Returns:
+        True if visit asked to stop
+    """
+    total = math.prod(len(c) for c in charsets)
+    stop = total if stop is None else min(stop, total)
+    width = len(charsets)
+    if width == 0:
+        return start < stop and visit(np.array([b'']))
+    
+    charsets_flat = np.frombuffer(''.join(charsets).encode('ascii'), dtype=np.uint8)
+    lengths = np.array([len(c) for c in charsets], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    # np.unravel_index needs the whole keyspace to be indexable
+    shape = tuple(lengths.tolist()) if total <= np.iinfo(np.intp).max else None
+    
+    # Candidates of up to 8 bytes are NUL-padded to one uint64 word per row
+    # (NumPy strips the padding again when reading them as bytes)
+    row_width = PACKED_WIDTH if width <= PACKED_WIDTH else width
+    out = np.zeros((BATCH_SIZE, row_width), dtype=np.uint8)
+    for block in range(start, stop, BATCH_SIZE):
+        count = min(BATCH_SIZE, stop - block)
+        _fill_block(charsets_flat, offsets, lengths, out, block, count, shape)
+        if visit(out[:count].view(f'S{row_width}').ravel()):
+            return True
+    return False
+
+
+def _scan_stream(candidates: Iterator[bytes], visit: Visitor) -> bool:
+    """Push a stream of candidates to visit in batches; True if visit stopped"""
+    while batch := list(itertools.islice(candidates, BATCH_SIZE)):
+        if visit(batch):
+            return True
+    return False
+
+
+# Set by the parent once any worker has found the target
+_scan_stop_event = None
+
+
+def _init_scan_worker(stop_event) -> None:
+    """Process pool initializer: share the stop event with the worker"""
+    global _scan_stop_event
+    _scan_stop_event = stop_event
+
+
+def _scan_slice(charsets: Tuple[str, ...], start: int, stop: int, target: bytes) -> int:
+    """
+    Worker: find target in candidates start..stop of a column product.
+    
+    Returns the absolute position of the match, or -1 if the slice holds no
+    match or another worker already found it.
+    """
+    position = start
+    match = -1
+    
+    def visit(batch) -> bool:
+        nonlocal position, match
+        if _scan_stop_event is not None and _scan_stop_event.is_set():
+            return True
+        index = _index_in_batch(batch, target)
+        if index >= 0:
+            match = position + index
+            return True
+        position += len(batch)
+        return False
+    
+    _scan_columns(charsets, visit, start, stop)
+    return match
+
+
+def _parallel_scan(
+    keyspaces: List[Tuple[str, ...]],
+    target: bytes,
+    limit: int,
+    workers: int
+) -> Tuple[Optional[int], int]:
+    """
+    Locate target in a sequence of keyspaces using a pool of processes.
+    
+    Each keyspace is split into index slices that workers enumerate with the
+    block kernel. Slices are collected in order so the reported position is
+    the first match, and a shared event stops the remaining workers early.
+    
+    Returns:
+        (position of target or None, number of candidates covered)
+    """
+    offset = 0
+    stop_event = multiprocessing.Event()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scan_worker,
+        initargs=(stop_event,)
+    ) as pool:
+        for charsets in keyspaces:
+            total = min(math.prod(len(c) for c in charsets), limit - offset)
+            if total <= 0:
+                break
+            
+            step = max(BATCH_SIZE, -(-total // (workers * 4)))
+            futures = [
+                pool.submit(_scan_slice, charsets, start, min(start + step, total), target)
+                for start in range(0, total, step)
+            ]
+            for future in futures:
+                index = future.result()
+                if index >= 0:
+                    stop_event.set()
+                    for pending in futures:
+                        pending.cancel()
+                    return offset + index, offset + total
+            
+            offset += total
+    
+    return None, offset
+
+
+def _sha256_target_digest(target_hash: str) -> Optional[bytes]:
+    """Decode target_hash as a SHA-256 digest, or None if it is not one"""
+    try:
+        digest = bytes.fromhex(target_hash)
+    except ValueError:
+        return None
+    return digest if len(digest) == VERIFY_DIGEST_SIZE else None
+
+
+def _verify_batch(
+    candidates,
+    target_digest: bytes,
+    algorithm: str = VERIFY_ALGORITHM,
+    rounds: int = 1
+) -> int:
+    """
+    Hash every candidate in a batch and return the first match, or -1.
+    
+    The target digest is decoded once per simulation; each batch costs one
+    digest chain (rounds deep) per candidate and a single C-level scan for
+    the target.
+    """
+    if isinstance(candidates, np.ndarray):
+        candidates = candidates.tolist()
+    digests = [hashlib.new(algorithm, candidate).digest() for candidate in candidates]
+    for _ in range(rounds - 1):
+        digests = [hashlib.new(algorithm, digest).digest() for digest in digests]
+    try:
+        return digests.index(target_digest)
+    except ValueError:
+        return -1
+
+
+def _index_in_batch(batch, target) -> int:
+    """Return the position of target in a candidate batch, or -1"""
+    if isinstance(batch, np.ndarray):
+        width = batch.dtype.itemsize
+        if width == PACKED_WIDTH and len(target) <= PACKED_WIDTH:
+            # Packed rows: compare whole uint64 words against the padded target
+            key = int.from_bytes(target.ljust(PACKED_WIDTH, b'\0'), 'little')
+            hits = np.flatnonzero(batch.view('<u8') == key)
+            return int(hits[0]) if hits.size else -1
+        
+        if len(target) != width:
+            # NumPy pads short rows with NULs, so only an elementwise compare
+            # handles a target shorter than the row width
+            hits = np.flatnonzero(batch == target)
+            return int(hits[0]) if hits.size else -1
+        
+        # Fixed-width rows: one C-level search of the packed buffer, keeping
+        # only hits that start on a row boundary
+        blob = batch.tobytes()
+        pos = blob.find(target)
+        while pos >= 0 and pos % width:
+            pos = blob.find(target, pos - pos % width + width)
+        return pos // width if pos >= 0 else -1
+    try:
+        return batch.index(target)
+    except ValueError:
+        return -1
+
+
 class AttackMode(Enum):
     """Supported attack simulation modes"""
     DICTIONARY = "dictionary"
@@ -27,19 +381,20 @@ class AttackMode(Enum):
     CREDENTIAL_STUFFING = "credential_stuffing"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttackConfig:
     """Configuration for attack simulation"""
     mode: AttackMode
-    target_hash: str
-    algorithm: HashAlgorithm
+    target_hash: str  # A hex SHA-256 digest switches on hash verification
+    algorithm: Optional[HashAlgorithm]  # Must be None when target_hash is a SHA-256 digest
     max_attempts: int = 1_000_000
     speed_limit: int = 10_000  # Attempts per second (realistic simulation)
-    charset: str = string.ascii_lowercase + string.digits
+    charset: str = DEFAULT_CHARSET
     min_length: int = 1
     max_length: int = 8
     wordlist_path: Optional[Path] = None
     mask: Optional[str] = None  # e.g., "?u?l?l?l?d?d?d?d"
+    workers: int = 1  # Processes scanning brute-force/mask keyspaces (1 = in-process)
 
 
 @dataclass
@@ -70,6 +425,8 @@ class AttackSimulator:
     def __init__(self, hash_engine: Optional[HashEngine] = None) -> None:
         self.hash_engine = hash_engine or HashEngine()
         self._stop_requested = False
+        # Candidate positions for static candidate lists, built on first use
+        self._static_lookups: Dict[AttackMode, Tuple[Dict[bytes, int], int]] = {}
     
     def simulate_attack(self, config: AttackConfig, target_password: str) -> AttackResult:
         """
@@ -81,7 +438,20 @@ class AttackSimulator:
             
         Returns:
             AttackResult with success status and statistics
+            
+        Raises:
+            ValueError: If config.target_hash is a SHA-256 digest but
+                config.algorithm names another algorithm
         """
+        # Hash verification is an unsalted SHA-256 demo, so refuse to present
+        # it as an attack on the configured algorithm
+        target_digest = _sha256_target_digest(config.target_hash)
+        if target_digest and config.algorithm is not None:
+            raise ValueError(
+                f"target_hash is a SHA-256 digest, which cannot be verified as "
+                f"{config.algorithm.value}; use algorithm=None for SHA-256 verification"
+            )
+        
         print(f"\n🎯 Starting {config.mode.value} attack simulation...")
         print(f"⚠️  SIMULATION ONLY - No real attacks are being performed\n")
         
@@ -90,19 +460,12 @@ class AttackSimulator:
         found = False
         stopped_by_limit = False
         
-        # Generate password candidates based on mode
-        if config.mode == AttackMode.DICTIONARY:
-            candidates = self._dictionary_generator(config)
-        elif config.mode == AttackMode.BRUTE_FORCE:
-            candidates = self._brute_force_generator(config)
-        elif config.mode == AttackMode.HYBRID:
-            candidates = self._hybrid_generator(config)
-        elif config.mode == AttackMode.MASK:
-            candidates = self._mask_generator(config)
-        elif config.mode == AttackMode.CREDENTIAL_STUFFING:
-            candidates = self._credential_stuffing_generator(config)
-        else:
-            raise ValueError(f"Unsupported attack mode: {config.mode}")
+        password_found: Optional[str] = None
+        
+        # Candidates are bytes, so encode the target once up front. When the
+        # config carries a SHA-256 digest, candidates are hashed and compared
+        # against it instead of the plaintext target.
+        target = target_password.encode('utf-8')
         
         # Simulate attack with progress bar
         with Progress(
@@ -113,91 +476,240 @@ class AttackSimulator:
         ) as progress:
             task = progress.add_task(
                 f"[cyan]Testing passwords...", 
-                total=min(config.max_attempts, 100000)
+                total=config.max_attempts
             )
             
-            for candidate in candidates:
-                # Rate limiting for realistic simulation
-                if attempts > 0 and attempts % config.speed_limit == 0:
-                    time.sleep(1.0)
-                
-                # Check if password matches
-                if candidate == target_password:
-                    found = True
-                    break
-                
-                attempts += 1
-                progress.update(task, advance=1)
-                
-                # Check limits
-                if attempts >= config.max_attempts:
-                    stopped_by_limit = True
-                    break
+            located = None if target_digest else self._locate(config, target)
+            if located is not None:
+                # Target position already known: pace the simulation up to it
+                position, count = located
+                goal = count if position is None else position
+                attempts = self._pace(config, progress, task, goal)
+                # stop() can end the replay before it reaches the target
+                found = position is not None and attempts == goal
+                if found:
+                    password_found = target_password
+                stopped_by_limit = not found and attempts >= config.max_attempts
+            else:
+                def visit(batch) -> bool:
+                    """Test one batch of candidates; return True to stop the scan"""
+                    nonlocal attempts, found, stopped_by_limit, password_found
+                    
+                    # Never test more candidates than the attempt limit allows
+                    remaining = config.max_attempts - attempts
+                    if len(batch) > remaining:
+                        batch = batch[:remaining]
+                    
+                    # Check if password matches (one vectorized scan of the whole batch)
+                    if target_digest:
+                        index = _verify_batch(batch, target_digest)
+                    else:
+                        index = _index_in_batch(batch, target)
+                    if index >= 0:
+                        attempts += index
+                        found = True
+                        password_found = bytes(batch[index]).decode('utf-8', 'replace')
+                        return True
+                    
+                    attempts += len(batch)
+                    progress.update(task, advance=len(batch))
+                    
+                    # Check limits
+                    if attempts >= config.max_attempts:
+                        stopped_by_limit = True
+                        return True
+                    
+                    if self._stop_requested:
+                        return True
+                    
+                    # Rate limiting for realistic simulation, paced once per batch
+                    time.sleep(len(batch) / config.speed_limit)
+                    return False
                 
-                if self._stop_requested:
-                    break
+                self._scan(config, visit)
         
         elapsed = time.time() - start_time
         
         return AttackResult(
             success=found,
-            password_found=target_password if found else None,
+            password_found=password_found,
             attempts=attempts,
             time_seconds=elapsed,
             mode=config.mode,
             stopped_by_limit=stopped_by_limit
         )
     
+    def _pace(self, config: AttackConfig, progress: Progress, task: TaskID, attempts: int) -> int:
+        """
+        Replay attempts already counted by _locate at the simulated speed.
+        
+        The bar advances one batch at a time, as in the streaming path, and
+        stop() ends the replay early.
+        
+        Returns:
+            Number of attempts replayed
+        """
+        paced = 0
+        while paced < attempts and not self._stop_requested:
+            step = min(BATCH_SIZE, attempts - paced)
+            time.sleep(step / config.speed_limit)
+            paced += step
+            progress.update(task, advance=step)
+        return paced
+    
     def stop(self) -> None:
         """Request simulation to stop"""
         self._stop_requested = True
     
     # Generator methods for different attack modes
     
-    def _dictionary_generator(self, config: AttackConfig) -> Iterator[str]:
-        """Generate passwords from a dictionary wordlist"""
+    def _scan(self, config: AttackConfig, visit: Visitor) -> None:
+        """
+        Push every candidate for the configured mode to visit, in order.
+        
+        Brute-force and mask keyspaces are enumerated by the block kernel;
+        the other modes stream their generators in batches.
+        """
+        keyspaces = self._keyspaces(config)
+        if keyspaces is not None:
+            for charsets in keyspaces:
+                if _scan_columns(charsets, visit):
+                    return
+            return
+        
+        if config.mode == AttackMode.DICTIONARY:
+            candidates = self._dictionary_generator(config)
+        elif config.mode == AttackMode.BRUTE_FORCE:
+            candidates = self._brute_force_generator(config)
+        elif config.mode == AttackMode.HYBRID:
+            candidates = self._hybrid_generator(config)
+        elif config.mode == AttackMode.MASK:
+            candidates = self._mask_generator(config)
+        elif config.mode == AttackMode.CREDENTIAL_STUFFING:
+            candidates = self._credential_stuffing_generator(config)
+        else:
+            raise ValueError(f"Unsupported attack mode: {config.mode}")
+        _scan_stream(candidates, visit)
+    
+    def _locate(self, config: AttackConfig, target: bytes) -> Optional[Tuple[Optional[int], int]]:
+        """
+        Find the target's position without streaming candidates, if possible.
+        
+        Small static candidate lists are answered from a cached index, and
+        brute-force/mask keyspaces are scanned by a process pool when
+        config.workers > 1.
+        
+        Returns:
+            (position of target or None, candidates covered), or None when
+            the attack has to stream its candidates
+        """
+        lookup = self._static_lookup(config)
+        if lookup is not None:
+            positions, count = lookup
+            if config.max_attempts < count:
+                return None
+            return positions.get(target), count
+        
+        if config.workers > 1:
+            keyspaces = self._keyspaces(config)
+            if keyspaces is not None:
+                return _parallel_scan(keyspaces, target, config.max_attempts, config.workers)
+        
+        return None
+    
+    def _keyspaces(self, config: AttackConfig) -> Optional[List[Tuple[str, ...]]]:
+        """Per-column charsets of each brute-force/mask keyspace, in order (ASCII only)"""
+        if not config.charset.isascii():
+            return None
+        if config.mode == AttackMode.MASK and config.mask:
+            return [_parse_mask(config.mask)] if config.mask.isascii() else None
+        if config.mode in (AttackMode.BRUTE_FORCE, AttackMode.MASK):
+            return [
+                (config.charset,) * length
+                for length in range(config.min_length, config.max_length + 1)
+            ]
+        return None
+    
+    def _static_lookup(self, config: AttackConfig) -> Optional[Tuple[Dict[bytes, int], int]]:
+        """
+        Get candidate positions for modes with a small, static candidate list.
+        
+        Returns a mapping of each candidate to its first position together
+        with the total candidate count, or None when the mode streams its
+        candidates (brute force, masks, hybrid or a wordlist file).
+        """
+        if config.mode == AttackMode.CREDENTIAL_STUFFING:
+            generator = self._credential_stuffing_generator
+        elif config.mode == AttackMode.DICTIONARY and not (
+            config.wordlist_path and config.wordlist_path.exists()
+        ):
+            generator = self._dictionary_generator
+        else:
+            return None
+        
+        if config.mode not in self._static_lookups:
+            positions: Dict[bytes, int] = {}
+            count = 0
+            for count, candidate in enumerate(generator(config), 1):
+                positions.setdefault(candidate, count - 1)
+            self._static_lookups[config.mode] = (positions, count)
+        
+        return self._static_lookups[config.mode]
+    
+    def _dictionary_generator(self, config: AttackConfig) -> Iterator[bytes]:
+        """
+        Generate passwords from a dictionary wordlist.
+        
+        The wordlist is memory-mapped and split on newlines in place, so
+        entries are yielded as raw bytes without per-line decoding.
+        """
         if not config.wordlist_path or not config.wordlist_path.exists():
             # Use default common passwords
             yield from self._default_wordlist()
-        else:
-            with open(config.wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    password = line.strip()
+            return
+        
+        with open(config.wordlist_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                
+                size = len(mm)
+                pos = 0
+                while pos < size:
+                    end = mm.find(b'\n', pos)
+                    if end < 0:
+                        end = size
+                    password = mm[pos:end].strip()
                     if password:
                         yield password
+                    pos = end + 1
     
-    def _brute_force_generator(self, config: AttackConfig) -> Iterator[str]:
+    def _brute_force_generator(self, config: AttackConfig) -> Iterator[bytes]:
         """Generate all possible passwords in charset within length range"""
         for length in range(config.min_length, config.max_length + 1):
-            for combo in itertools.product(config.charset, repeat=length):
-                yield ''.join(combo)
+            yield from _enumerate_columns((config.charset,) * length)
     
-    def _hybrid_generator(self, config: AttackConfig) -> Iterator[str]:
+    def _hybrid_generator(self, config: AttackConfig) -> Iterator[bytes]:
         """
         Generate passwords using dictionary + mutations.
         Combines wordlist with common mutations (l33t speak, appending numbers, etc.)
         """
-        # First try dictionary as-is
         for word in self._dictionary_generator(config):
-            yield word
+            if word.isascii():
+                yield from _hybrid_mutations(word, HYBRID_SUFFIXES, LEET_TABLE)
+                continue
             
-            # Common mutations
-            yield word.capitalize()
-            yield word.upper()
-            yield word.lower()
-            
-            # Append common numbers
-            for num in ['1', '123', '2024', '2025', '!']:
-                yield word + num
-                yield word.capitalize() + num
-            
-            # L33t speak substitutions
-            leet_map = {'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'}
-            leet_word = ''.join(leet_map.get(c.lower(), c) for c in word)
-            if leet_word != word:
-                yield leet_word
+            # bytes case methods only change ASCII letters, so entries such
+            # as "straße" are mutated as text and re-encoded
+            text = word.decode('utf-8', 'surrogateescape')
+            for candidate in _hybrid_mutations(text, HYBRID_TEXT_SUFFIXES, LEET_TEXT_TABLE):
+                yield candidate.encode('utf-8', 'surrogateescape')
     
-    def _mask_generator(self, config: AttackConfig) -> Iterator[str]:
+    def _mask_generator(self, config: AttackConfig) -> Iterator[bytes]:
         """
         Generate passwords based on a mask pattern.
         
@@ -214,59 +726,22 @@ class AttackSimulator:
             yield from self._brute_force_generator(config)
             return
         
-        # Parse mask into character sets
-        charsets = []
-        mask = config.mask
-        i = 0
-        
-        while i < len(mask):
-            if mask[i] == '?' and i + 1 < len(mask):
-                placeholder = mask[i+1]
-                if placeholder == 'l':
-                    charsets.append(string.ascii_lowercase)
-                elif placeholder == 'u':
-                    charsets.append(string.ascii_uppercase)
-                elif placeholder == 'd':
-                    charsets.append(string.digits)
-                elif placeholder == 's':
-                    charsets.append('!@#$%^&*()_+-=[]{}|;:,.<>?')
-                elif placeholder == 'a':
-                    charsets.append(string.ascii_letters + string.digits + string.punctuation)
-                i += 2
-            else:
-                # Literal character
-                charsets.append([mask[i]])
-                i += 1
-        
         # Generate all combinations
-        for combo in itertools.product(*charsets):
-            yield ''.join(combo)
+        yield from _enumerate_columns(_parse_mask(config.mask))
     
-    def _credential_stuffing_generator(self, config: AttackConfig) -> Iterator[str]:
+    def _credential_stuffing_generator(self, config: AttackConfig) -> Iterator[bytes]:
         """
         Simulate credential stuffing attack (DEMO ONLY).
         Uses fake credential pairs for educational demonstration.
         """
         # DEMO credentials only - NOT REAL
-        demo_credentials = [
-            ("user1@example.com", "Password123!"),
-            ("testuser@demo.com", "Welcome2024"),
-            ("admin@test.local", "Admin@123"),
-            ("demo@email.com", "Summer2024!"),
-        ]
-        
-        for email, password in demo_credentials:
+        for email, password in DEMO_CREDENTIALS:
             yield password
     
     @staticmethod
-    def _default_wordlist() -> List[str]:
+    def _default_wordlist() -> Tuple[bytes, ...]:
         """Default common passwords for simulation"""
-        return [
-            "password", "123456", "12345678", "qwerty", "abc123",
-            "password123", "admin", "letmein", "welcome", "monkey",
-            "dragon", "master", "sunshine", "princess", "football",
-            "iloveyou", "shadow", "michael", "superman", "trustno1",
-        ]
+        return DEFAULT_WORDLIST
 
 
 class GPUSimulator:
@@ -274,25 +749,29 @@ class GPUSimulator:
     Simulates GPU-accelerated password cracking performance.
     
     Provides realistic performance estimates without actual GPU usage.
-    Educational demonstration of why GPU cracking is effective.
+    Educational demonstration of why GPU cracking is effective. The only
+    measured figures come from the CPU (measure_cpu_throughput); there is
+    no device backend.
     """
     
-    # Simulated performance for different GPU tiers (hashes/second)
+    # Simulated performance for different GPU tiers (hashes/second). Argon2id
+    # is quoted at 64 MiB and rescaled to HashEngine's default preset, so the
+    # RTX 4090 row matches HashEngine().gpu_performance.
     GPU_TIERS = {
         "RTX_4090": {
-            HashAlgorithm.ARGON2ID: 50_000,
+            HashAlgorithm.ARGON2ID: HashEngine.scaled_argon2_rate(50_000, _DEFAULT_ARGON2_MEMORY),
             HashAlgorithm.SCRYPT: 100_000,
             HashAlgorithm.PBKDF2_SHA256: 10_000_000,
             HashAlgorithm.BCRYPT: 500_000,
         },
         "RTX_3080": {
-            HashAlgorithm.ARGON2ID: 30_000,
+            HashAlgorithm.ARGON2ID: HashEngine.scaled_argon2_rate(30_000, _DEFAULT_ARGON2_MEMORY),
             HashAlgorithm.SCRYPT: 60_000,
             HashAlgorithm.PBKDF2_SHA256: 6_000_000,
             HashAlgorithm.BCRYPT: 300_000,
         },
         "CPU_ONLY": {
-            HashAlgorithm.ARGON2ID: 1_000,
+            HashAlgorithm.ARGON2ID: HashEngine.scaled_argon2_rate(1_000, _DEFAULT_ARGON2_MEMORY),
             HashAlgorithm.SCRYPT: 2_000,
             HashAlgorithm.PBKDF2_SHA256: 100_000,
             HashAlgorithm.BCRYPT: 10_000,
@@ -323,3 +802,38 @@ class GPUSimulator:
     def get_performance_comparison(cls) -> Dict[str, Dict[HashAlgorithm, int]]:
         """Get full performance comparison across all GPU tiers"""
         return cls.GPU_TIERS
+    
+    @staticmethod
+    def verify_batch_cpu(candidates: List[bytes], target_digest: bytes, rounds: int = 1) -> int:
+        """
+        Verify a batch of candidates against a SHA-256 digest on the CPU.
+        
+        Computes one digest chain per candidate (rounds iterations of
+        SHA-256) with hashlib; nothing runs on a GPU.
+        
+        Args:
+            candidates: Candidate passwords
+            target_digest: Raw SHA-256 digest to find
+            rounds: Hash iterations per candidate
+            
+        Returns:
+            Index of the first matching candidate, or -1
+        """
+        return _verify_batch(candidates, target_digest, rounds=rounds)
+    
+    @classmethod
+    def measure_cpu_throughput(cls, batch_size: int = 100_000, rounds: int = 1) -> float:
+        """
+        Measure real batched SHA-256 verification speed on this machine's CPU.
+        
+        Gives a measured CPU reference point next to the simulated GPU_TIERS;
+        it is not a GPU figure.
+        
+        Returns:
+            Candidates verified per second
+        """
+        candidates = [b'%08d' % i for i in range(batch_size)]
+        start = time.perf_counter()
+        cls.verify_batch_cpu(candidates, bytes(VERIFY_DIGEST_SIZE), rounds)
+        elapsed = time.perf_counter() - start
+        return batch_size / elapsed if elapsed > 0 else float('inf')
@@ -4,17 +4,36 @@ Defense Simulator - Demonstrates Security Defenses Against Password Attacks
 Educational module showing how various defense mechanisms protect against attacks.
 """
 
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 import time
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn
+from rich.progress import Progress, BarColumn, TaskID, TextColumn
+
+
+# Progress bar updates (and simulated pauses) per defense demo
+PROGRESS_STEPS = 100
+
+
+# Initial capacity of the per-username / per-IP state arrays
+_INITIAL_IDS = 64
+
+# DefenseSimulator attributes indexed by _get_id(), grown together
+_STATE_ARRAYS = ('failed_attempts', 'lockout_expiry', 'ip_minute_counts', 'ip_minute_start')
+
+
+def _chunks(total: int) -> Iterator[range]:
+    """Split range(total) into about PROGRESS_STEPS consecutive chunks"""
+    size = max(1, total // PROGRESS_STEPS)
+    for start in range(0, total, size):
+        yield range(start, min(start + size, total))
 
 
 class DefenseType(Enum):
@@ -80,10 +99,17 @@ class DefenseSimulator:
     def __init__(self, config: Optional[DefenseConfig] = None) -> None:
         self.config = config or DefenseConfig()
         self.attempt_history: List[LoginAttempt] = []
-        self.failed_attempts: Dict[str, int] = defaultdict(int)
-        self.locked_accounts: Dict[str, datetime] = {}
-        self.ip_attempts: Dict[str, List[datetime]] = defaultdict(list)
+        
+        # Per-username / per-IP state as parallel arrays indexed by _get_id().
+        # Times are time.monotonic() seconds; a lockout expiry of 0 means unlocked.
+        self._ids: Dict[str, int] = {}
+        self.failed_attempts = np.zeros(_INITIAL_IDS, dtype=np.int32)
+        self.lockout_expiry = np.zeros(_INITIAL_IDS, dtype=np.float64)
+        self.ip_minute_counts = np.zeros(_INITIAL_IDS, dtype=np.int32)
+        self.ip_minute_start = np.zeros(_INITIAL_IDS, dtype=np.float64)
+        
         self.console = Console()
+        self._progress: Optional[Progress] = None
         
         # Initialize honeytoken passwords
         if self.config.honeytoken_passwords is None:
@@ -91,6 +117,68 @@ class DefenseSimulator:
                 "admin", "password", "123456", "root", "admin123"
             ]
     
+    def _get_id(self, name: str) -> int:
+        """Intern a username or IP address as an index into the state arrays"""
+        uid = self._ids.get(name)
+        if uid is None:
+            uid = self._ids[name] = len(self._ids)
+            if uid == len(self.failed_attempts):
+                # Double the state arrays when they fill up
+                for attr in _STATE_ARRAYS:
+                    old = getattr(self, attr)
+                    grown = np.zeros(2 * len(old), dtype=old.dtype)
+                    grown[:len(old)] = old
+                    setattr(self, attr, grown)
+        return uid
+    
+    def record_failed_login(self, username: str) -> bool:
+        """
+        Count a failed login and lock the account at the lockout threshold.
+        
+        Returns:
+            True if the account is (now) locked
+        """
+        uid = self._get_id(username)
+        now = time.monotonic()
+        if self.lockout_expiry[uid] > now:
+            return True
+        
+        self.failed_attempts[uid] += 1
+        if self.failed_attempts[uid] >= self.config.lockout_threshold:
+            self.lockout_expiry[uid] = now + self.config.lockout_duration_minutes * 60.0
+            self.failed_attempts[uid] = 0
+            return True
+        return False
+    
+    def is_locked(self, username: str) -> bool:
+        """Check whether an account is currently locked out"""
+        uid = self._ids.get(username)
+        return uid is not None and self.lockout_expiry[uid] > time.monotonic()
+    
+    def release_expired_lockouts(self) -> int:
+        """Unlock every account whose lockout has expired; returns how many"""
+        expired = (self.lockout_expiry > 0) & (self.lockout_expiry <= time.monotonic())
+        self.lockout_expiry[expired] = 0.0
+        return int(np.count_nonzero(expired))
+    
+    def record_ip_attempt(self, ip_address: str) -> bool:
+        """
+        Count an attempt from an IP address against the per-minute limit.
+        
+        Returns:
+            True if the attempt is allowed, False if the IP is throttled
+        """
+        uid = self._get_id(ip_address)
+        now = time.monotonic()
+        if now - self.ip_minute_start[uid] >= 60.0:
+            self.ip_minute_start[uid] = now
+            self.ip_minute_counts[uid] = 0
+        
+        if self.ip_minute_counts[uid] >= self.config.ip_max_attempts:
+            return False
+        self.ip_minute_counts[uid] += 1
+        return True
+    
     def simulate_defense(
         self, 
         defense_type: DefenseType,
@@ -100,6 +188,8 @@ class DefenseSimulator:
         """
         Simulate a defense mechanism against an attack.
         
+        The live progress display is stopped again before returning.
+        
         Args:
             defense_type: Type of defense to demonstrate
             attack_attempts: Number of attack attempts to simulate
@@ -107,20 +197,54 @@ class DefenseSimulator:
         """
         self.console.print(f"\n[bold cyan]🛡️  Simulating {defense_type.value.replace('_', ' ').title()}[/bold cyan]\n")
         
-        if defense_type == DefenseType.RATE_LIMITING:
-            self._demo_rate_limiting(attack_attempts, attack_rate)
-        elif defense_type == DefenseType.ACCOUNT_LOCKOUT:
-            self._demo_account_lockout(attack_attempts)
-        elif defense_type == DefenseType.PROGRESSIVE_DELAY:
-            self._demo_progressive_delay(attack_attempts)
-        elif defense_type == DefenseType.IP_THROTTLING:
-            self._demo_ip_throttling(attack_attempts)
-        elif defense_type == DefenseType.HONEYTOKEN:
-            self._demo_honeytoken()
-        elif defense_type == DefenseType.MFA:
-            self._demo_mfa()
-        else:
-            self.console.print(f"[yellow]Defense type {defense_type} not yet implemented[/yellow]")
+        try:
+            if defense_type == DefenseType.RATE_LIMITING:
+                self._demo_rate_limiting(attack_attempts, attack_rate)
+            elif defense_type == DefenseType.ACCOUNT_LOCKOUT:
+                self._demo_account_lockout(attack_attempts)
+            elif defense_type == DefenseType.PROGRESSIVE_DELAY:
+                self._demo_progressive_delay(attack_attempts)
+            elif defense_type == DefenseType.IP_THROTTLING:
+                self._demo_ip_throttling(attack_attempts)
+            elif defense_type == DefenseType.HONEYTOKEN:
+                self._demo_honeytoken()
+            elif defense_type == DefenseType.MFA:
+                self._demo_mfa()
+            else:
+                self.console.print(f"[yellow]Defense type {defense_type} not yet implemented[/yellow]")
+        finally:
+            self.close()
+    
+    def _shared_progress(self) -> Progress:
+        """Get the progress display shared by all demos, starting it if stopped"""
+        if self._progress is None:
+            self._progress = Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=self.console,
+            )
+        if not self._progress.live.is_started:
+            self._progress.start()
+        return self._progress
+    
+    def _finish_task(self, task: TaskID) -> None:
+        """Print a task's final bar and drop it from the shared live display"""
+        progress = self._shared_progress()
+        finished = [t for t in progress.tasks if t.id == task]
+        self.console.print(progress.make_tasks_table(finished))
+        progress.remove_task(task)
+    
+    def close(self) -> None:
+        """Stop the shared progress display if it is running (it is kept for reuse)"""
+        if self._progress is not None and self._progress.live.is_started:
+            self._progress.stop()
+    
+    def __enter__(self) -> "DefenseSimulator":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
     
     def _demo_rate_limiting(self, attempts: int, rate: int) -> None:
         """Demonstrate rate limiting defense"""
@@ -131,33 +255,32 @@ class DefenseSimulator:
             f"[yellow]⚙️  Rate Limit: {self.config.max_attempts_per_minute} attempts/minute[/yellow]\n"
         )
         
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        ) as progress:
-            task = progress.add_task("[cyan]Attack simulation...", total=attempts)
-            
+        progress = self._shared_progress()
+        task = progress.add_task("[cyan]Attack simulation...", total=attempts)
+        try:
             minute_attempts = 0
-            minute_start = datetime.now()
+            minute_start = time.monotonic()
             
-            for i in range(attempts):
-                current_time = datetime.now()
+            for chunk in _chunks(attempts):
+                for i in chunk:
+                    current_time = time.monotonic()
+                    
+                    # Reset counter every minute
+                    if current_time - minute_start >= 60.0:
+                        minute_attempts = 0
+                        minute_start = current_time
+                    
+                    # Check rate limit
+                    if minute_attempts < self.config.max_attempts_per_minute:
+                        allowed += 1
+                        minute_attempts += 1
+                    else:
+                        blocked += 1
                 
-                # Reset counter every minute
-                if (current_time - minute_start).seconds >= 60:
-                    minute_attempts = 0
-                    minute_start = current_time
-                
-                # Check rate limit
-                if minute_attempts < self.config.max_attempts_per_minute:
-                    allowed += 1
-                    minute_attempts += 1
-                else:
-                    blocked += 1
-                
-                progress.update(task, advance=1)
-                time.sleep(1.0 / rate)  # Simulate attack rate
+                progress.update(task, advance=len(chunk))
+                time.sleep(len(chunk) / rate)  # Simulate attack rate
+        finally:
+            self._finish_task(task)
         
         # Display results
         self._display_defense_results(
@@ -171,37 +294,37 @@ class DefenseSimulator:
         """Demonstrate account lockout after failed attempts"""
         blocked = 0
         allowed = 0
-        failed_count = 0
-        locked = False
+        username = "demo_user"
         
         self.console.print(
             f"[yellow]⚙️  Lockout after {self.config.lockout_threshold} failed attempts "
             f"for {self.config.lockout_duration_minutes} minutes[/yellow]\n"
         )
         
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        ) as progress:
-            task = progress.add_task("[cyan]Attack simulation...", total=attempts)
-            
-            for i in range(attempts):
-                if locked:
-                    blocked += 1
-                elif failed_count < self.config.lockout_threshold:
+        # A lockout from an earlier run only ends once it has expired
+        self.release_expired_lockouts()
+        
+        progress = self._shared_progress()
+        task = progress.add_task("[cyan]Attack simulation...", total=attempts)
+        try:
+            for chunk in _chunks(attempts):
+                for i in chunk:
+                    if self.is_locked(username):
+                        blocked += 1
+                        continue
+                    
                     allowed += 1
-                    failed_count += 1
-                else:
-                    # Account locked!
-                    locked = True
-                    blocked += 1
-                    self.console.print(
-                        f"\n[red]🔒 Account locked after {failed_count} failed attempts![/red]\n"
-                    )
+                    if self.record_failed_login(username):
+                        # Account locked!
+                        self.console.print(
+                            f"\n[red]🔒 Account locked after "
+                            f"{self.config.lockout_threshold} failed attempts![/red]\n"
+                        )
                 
-                progress.update(task, advance=1)
-                time.sleep(0.01)
+                progress.update(task, advance=len(chunk))
+                time.sleep(0.01 * len(chunk))
+        finally:
+            self._finish_task(task)
         
         self._display_defense_results(
             "Account Lockout",
@@ -212,18 +335,14 @@ class DefenseSimulator:
     
     def _demo_progressive_delay(self, attempts: int) -> None:
         """Demonstrate progressive delay (exponential backoff)"""
-        blocked = 0
-        total_delay = 0.0
-        
         self.console.print(
             "[yellow]⚙️  Progressive delay increases with each failed attempt[/yellow]\n"
         )
         
-        delays = []
-        for i in range(min(attempts, 10)):
-            delay = self.config.base_delay_ms * (2 ** i) / 1000.0  # Exponential backoff
-            delays.append(delay)
-            total_delay += delay
+        # Exponential backoff schedule and its running total in one pass
+        steps = np.arange(min(attempts, 10), dtype=np.int64)
+        delays = (self.config.base_delay_ms * (1 << steps)) / 1000.0
+        cumulative_delays = np.cumsum(delays)
         
         # Display delay progression table
         table = Table(title="Progressive Delay Schedule")
@@ -231,15 +350,14 @@ class DefenseSimulator:
         table.add_column("Delay", style="yellow")
         table.add_column("Cumulative", style="green")
         
-        cumulative = 0.0
-        for i, delay in enumerate(delays[:10], 1):
-            cumulative += delay
+        for i, (delay, cumulative) in enumerate(zip(delays.tolist(), cumulative_delays.tolist()), 1):
             table.add_row(
                 str(i),
                 f"{delay:.2f}s",
                 f"{cumulative:.2f}s"
             )
         
+        cumulative = cumulative_delays[-1] if len(cumulative_delays) else 0.0
         self.console.print(table)
         self.console.print(
             f"\n[green]✓ After 10 attempts, attacker has wasted {cumulative:.2f} seconds[/green]"
@@ -255,37 +373,32 @@ class DefenseSimulator:
         
         self.console.print(
             f"[yellow]⚙️  IP Throttling: Max {self.config.ip_max_attempts} "
-            f"attempts per IP[/yellow]\n"
+            f"attempts per IP per minute[/yellow]\n"
         )
         
         # Simulate attacks from multiple IPs
         ips = [f"192.168.1.{i}" for i in range(1, 6)]
-        ip_counts = {ip: 0 for ip in ips}
         
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        ) as progress:
-            task = progress.add_task("[cyan]Multi-IP attack...", total=attempts)
-            
-            for i in range(attempts):
-                ip = ips[i % len(ips)]
-                
-                if ip_counts[ip] < self.config.ip_max_attempts:
-                    allowed += 1
-                    ip_counts[ip] += 1
-                else:
-                    blocked += 1
+        progress = self._shared_progress()
+        task = progress.add_task("[cyan]Multi-IP attack...", total=attempts)
+        try:
+            for chunk in _chunks(attempts):
+                for i in chunk:
+                    if self.record_ip_attempt(ips[i % len(ips)]):
+                        allowed += 1
+                    else:
+                        blocked += 1
                 
-                progress.update(task, advance=1)
-                time.sleep(0.01)
+                progress.update(task, advance=len(chunk))
+                time.sleep(0.01 * len(chunk))
+        finally:
+            self._finish_task(task)
         
         self._display_defense_results(
             "IP Throttling",
             allowed,
             blocked,
-            f"{self.config.ip_max_attempts} attempts per IP"
+            f"{self.config.ip_max_attempts} attempts per IP per minute"
         )
     
     def _demo_honeytoken(self) -> None:
@@ -4,20 +4,190 @@ Hash Engine - Secure Password Hashing and Verification
 Supports multiple modern hashing algorithms and provides time-to-crack estimation.
 """
 
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Protocol, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+import base64
+import bisect
+import functools
 import hashlib
+import hmac
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import warnings
 import time
 import math
 from dataclasses import dataclass
+from pathlib import Path
 from enum import Enum
 
 import argon2
+from argon2.low_level import Type, hash_secret_raw
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 import bcrypt
-import secrets
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+_SECONDS_PER_YEAR = 31536000
+
+# Upper bounds (exclusive) of the _format_time buckets, in seconds
+_TIME_THRESHOLDS = (
+    1,
+    60,
+    3600,
+    86400,
+    _SECONDS_PER_YEAR,
+    _SECONDS_PER_YEAR * 100,
+    _SECONDS_PER_YEAR * 1000,
+    _SECONDS_PER_YEAR * 1_000_000,
+    _SECONDS_PER_YEAR * 1_000_000_000,
+)
+
+# Unit size in seconds and format for each bucket (one more than the thresholds)
+_TIME_UNITS = (
+    (1e-3, "%.2f milliseconds"),
+    (1, "%.2f seconds"),
+    (60, "%.2f minutes"),
+    (3600, "%.2f hours"),
+    (86400, "%.2f days"),
+    (_SECONDS_PER_YEAR, "%.2f years"),
+    (_SECONDS_PER_YEAR, "%.0f years"),
+    (_SECONDS_PER_YEAR * 1000, "%.0f thousand years"),
+    (_SECONDS_PER_YEAR * 1_000_000, "%.0f million years"),
+    (_SECONDS_PER_YEAR * 1_000_000_000, "%.0f billion years"),
+)
+
+# Bucket lookup by binary exponent: entry k + 1 is the bucket of 2**k, for
+# k = floor(log2(seconds)) clamped to -1..63. Each threshold lies in its own
+# power-of-two interval, so the true bucket is that entry or the next one,
+# settled by one comparison against _BUCKET_BOUNDS.
+_BUCKET_LUT = tuple(bisect.bisect_right(_TIME_THRESHOLDS, 2.0 ** k) for k in range(-1, 64))
+_BUCKET_BOUNDS = _TIME_THRESHOLDS + (math.inf,)
+
+
+def _time_bucket(seconds: float) -> int:
+    """Index into _TIME_UNITS for a finite, non-negative number of seconds"""
+    exponent = min(max(math.frexp(seconds)[1] - 1, -1), 63)
+    bucket = _BUCKET_LUT[exponent + 1]
+    return bucket + (seconds >= _BUCKET_BOUNDS[bucket])
+
+
+# Standard base64 alphabet -> bcrypt's "./A-Za-z0-9" alphabet
+_BCRYPT_B64 = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+)
+
+# getrandom(2) is Linux-only; urandom reads the same kernel CSPRNG elsewhere
+_random_bytes = getattr(os, "getrandom", os.urandom)
+
+
+class _SaltPool:
+    """
+    Hands out random salts sliced from one large kernel RNG read.
+    
+    Bulk hashing would otherwise make one syscall per salt. A lock keeps
+    threads sharing one HashEngine from being handed the same bytes, and the
+    buffer is dropped after a fork so child processes never reuse the
+    parent's bytes.
+    """
+    
+    def __init__(self, chunk: int = 4096) -> None:
+        self._chunk = chunk
+        self._buf = b""
+        self._off = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+    
+    def take(self, n: int = 16) -> bytes:
+        """Return n fresh random bytes"""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._buf, self._off, self._pid = b"", 0, os.getpid()
+            if self._off + n > len(self._buf):
+                self._buf = self._fill(max(self._chunk, n))
+                self._off = 0
+            salt = self._buf[self._off:self._off + n]
+            self._off += n
+        assert len(salt) == n
+        return salt
+    
+    @staticmethod
+    def _fill(size: int) -> bytes:
+        """Read exactly size random bytes (getrandom may return fewer)"""
+        buf = _random_bytes(size)
+        while len(buf) < size:
+            buf += _random_bytes(size - len(buf))
+        return buf
+
+
+def _bcrypt_salt(raw: bytes, rounds: int) -> bytes:
+    """Format 16 raw bytes as a bcrypt '$2b$' salt, as bcrypt.gensalt does"""
+    return b"$2b$%02d$" % rounds + base64.b64encode(raw)[:22].translate(_BCRYPT_B64)
+
+
+# Where hashcat benchmark results are kept between runs
+_GPU_RATES_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "ciphersim" / "gpu_rates.json"
+)
+
+# "Speed.#1.........:  1667 H/s (..." / "Speed.#*.........:  1.2 MH/s (..."
+_HASHCAT_SPEED = re.compile(r"^Speed\.#(\*|\d+)\.*:\s*([\d.]+)\s*([kMGT]?)H/s", re.MULTILINE)
+_HASHCAT_UNITS = {"": 1, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12}
+
+
+def _parse_hashcat_speed(output: str) -> Optional[float]:
+    """Total hashes/second from `hashcat -b` output, or None if absent"""
+    speeds = {}
+    for device, value, unit in _HASHCAT_SPEED.findall(output):
+        speeds[device] = float(value) * _HASHCAT_UNITS[unit]
+    if "*" in speeds:
+        return speeds["*"]
+    return sum(speeds.values()) or None
+
+
+# Selected mode is bracketed, e.g. "always [madvise] never"
+_THP_ENABLED = Path("/sys/kernel/mm/transparent_hugepage/enabled")
+
+
+@functools.cache
+def _warn_if_hugepages_disabled() -> None:
+    """
+    Warn once if Linux transparent hugepages are switched off.
+    
+    argon2-cffi allocates the Argon2 memory matrix itself, so it cannot be
+    handed a madvise(MADV_HUGEPAGE) buffer. With THP set to "always" the
+    kernel backs it with 2 MiB pages anyway, which cuts TLB misses in the
+    memory-hard fill; with "never" every 4 KiB page costs a TLB entry.
+    """
+    try:
+        modes = _THP_ENABLED.read_text()
+    except OSError:
+        return  # Not Linux, or no THP support
+    if "[never]" in modes:
+        warnings.warn(
+            "Transparent hugepages are disabled; Argon2id hashing will be slower "
+            f"(set {_THP_ENABLED} to 'always' to enable them)",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+
+
+@functools.cache
+def _numba_crack_grid() -> Optional[Callable]:
+    """Numba crack-time grid kernel if the optional 'jit' extra is installed, else None"""
+    try:
+        from ._crack_grid import log2_crack_grid
+    except ImportError:
+        return None
+    return log2_crack_grid
 
 
 class HashAlgorithm(Enum):
@@ -29,6 +199,26 @@ class HashAlgorithm(Enum):
     BCRYPT = "bcrypt"
 
 
+class Argon2Backend(Protocol):
+    """
+    Argon2id implementation used by HashEngine.
+    
+    Matches the argon2.PasswordHasher interface, so any binding exposing the
+    same methods and parameters (e.g. a Rust-backed one) can be plugged in.
+    """
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    
+    def hash(self, password: str) -> str:
+        """Return an encoded $argon2id$... hash"""
+        ...
+    
+    def verify(self, hash: str, password: str) -> bool:
+        """Return True on match; raise on mismatch"""
+        ...
+
+
 @dataclass
 class HashResult:
     """Result of password hashing operation"""
@@ -37,6 +227,44 @@ class HashResult:
     salt: Optional[str]
     time_ms: float
     parameters: Dict[str, any]
+    time_ns: int = 0  # Exact elapsed time; time_ms is derived from it
+
+
+# Integer codes for HashAlgorithm in HashResultBatch.algorithms
+_ALGORITHM_CODES = tuple(HashAlgorithm)
+
+
+@dataclass
+class HashResultBatch:
+    """
+    Results of HashEngine.hash_many, stored column-wise.
+    
+    Timings are NumPy arrays so statistics are one call (np.mean,
+    np.percentile) over the column. Indexing or iterating yields ordinary
+    HashResults for code that wants one record at a time.
+    """
+    algorithms: "np.ndarray"  # uint8 codes into _ALGORITHM_CODES
+    hash_values: List[str]
+    salts: List[Optional[str]]
+    time_ms: "np.ndarray"
+    time_ns: "np.ndarray"
+    parameters: List[Dict[str, any]]
+    
+    def __len__(self) -> int:
+        return len(self.hash_values)
+    
+    def __getitem__(self, index: int) -> HashResult:
+        return HashResult(
+            algorithm=_ALGORITHM_CODES[self.algorithms[index]],
+            hash_value=self.hash_values[index],
+            salt=self.salts[index],
+            time_ms=float(self.time_ms[index]),
+            parameters=self.parameters[index],
+            time_ns=int(self.time_ns[index]),
+        )
+    
+    def __iter__(self) -> Iterator[HashResult]:
+        return (self[i] for i in range(len(self)))
 
 
 @dataclass
@@ -44,8 +272,14 @@ class CrackEstimate:
     """Time-to-crack estimation"""
     seconds: float
     human_readable: str
-    hashes_required: int
     algorithm: HashAlgorithm
+    password_length: int
+    charset_size: int
+    
+    @property
+    def hashes_required(self) -> int:
+        """Average-case guesses (half the keyspace); computed exactly on demand"""
+        return pow(self.charset_size, self.password_length) >> 1
 
 
 class HashEngine:
@@ -59,8 +293,21 @@ class HashEngine:
     - bcrypt (legacy but still common)
     """
     
+    # Argon2id cost presets (memory_cost in KiB):
+    # - owasp: OWASP Password Storage Cheat Sheet minimum (19 MiB, t=2, p=1)
+    # - tobtu: tobtu.com minimum at t=1 (46 MiB)
+    # - paranoid: the previous 64 MiB, t=3, p=4 setting
+    # At these sizes GPU attack speed is bound by memory, so the defender pays
+    # less latency and RAM at owasp/tobtu for a comparable attack bound.
+    ARGON2_PRESETS = {
+        "owasp": {"time_cost": 2, "memory_cost": 19456, "parallelism": 1},
+        "tobtu": {"time_cost": 1, "memory_cost": 47104, "parallelism": 1},
+        "paranoid": {"time_cost": 3, "memory_cost": 65536, "parallelism": 4},
+    }
+    
     # Simulated GPU performance (hashes/second for different algorithms)
-    # Based on RTX 4090 benchmarks
+    # Based on RTX 4090 benchmarks; Argon2id is quoted for the 64 MiB paranoid
+    # preset and rescaled per engine by scaled_argon2_rate()
     GPU_PERFORMANCE = {
         HashAlgorithm.ARGON2ID: 50_000,      # Very slow on GPU (memory-hard)
         HashAlgorithm.SCRYPT: 100_000,       # Slow on GPU (memory-hard)
@@ -69,14 +316,101 @@ class HashEngine:
         HashAlgorithm.BCRYPT: 500_000,       # Moderate on GPU
     }
     
-    def __init__(self) -> None:
-        self.argon2_hasher = argon2.PasswordHasher(
-            time_cost=3,        # Number of iterations
-            memory_cost=65536,  # 64 MB
-            parallelism=4,      # Number of parallel threads
+    # hashcat -m modes used to calibrate GPU_PERFORMANCE on local hardware
+    HASHCAT_MODES = {
+        HashAlgorithm.ARGON2ID: 34000,
+        HashAlgorithm.SCRYPT: 8900,
+        HashAlgorithm.PBKDF2_SHA256: 10900,
+        HashAlgorithm.PBKDF2_SHA512: 12100,
+        HashAlgorithm.BCRYPT: 3200,
+    }
+    
+    def __init__(
+        self,
+        argon2_backend: Optional[Argon2Backend] = None,
+        preset: str = "owasp",
+        calibrate_gpu: bool = False
+    ) -> None:
+        """
+        Args:
+            argon2_backend: Argon2id implementation (default: argon2-cffi)
+            preset: Argon2id cost preset for the default backend
+                ('owasp', 'tobtu' or 'paranoid')
+            calibrate_gpu: Replace the RTX 4090 rates with hashcat benchmarks
+                of the local GPU (cached after the first run)
+        """
+        if preset not in self.ARGON2_PRESETS:
+            raise ValueError(f"Unknown Argon2 preset: {preset}")
+        
+        # Pluggable Argon2id implementation; argon2-cffi by default
+        self.argon2_hasher: Argon2Backend = argon2_backend or argon2.PasswordHasher(
+            **self.ARGON2_PRESETS[preset],
             hash_len=32,        # Hash output length
             salt_len=16,        # Salt length
         )
+        self._salt_pool = _SaltPool()
+        
+        # Attack rates for this engine's Argon2id cost (class rates are for 64 MiB)
+        rates = self._load_gpu_rates() if calibrate_gpu else self.GPU_PERFORMANCE
+        self.gpu_performance = {
+            **rates,
+            HashAlgorithm.ARGON2ID: self.scaled_argon2_rate(
+                rates[HashAlgorithm.ARGON2ID], self.argon2_hasher.memory_cost
+            ),
+        }
+    
+    @classmethod
+    def scaled_argon2_rate(cls, rate: float, memory_cost: int) -> int:
+        """
+        Rescale an Argon2id attack rate quoted at 64 MiB to memory_cost KiB.
+        
+        GPU attacks on Argon2id are bound by memory, so the rate scales with
+        1/memory_cost; time_cost is not modelled.
+        """
+        return round(rate * cls.ARGON2_PRESETS["paranoid"]["memory_cost"] / memory_cost)
+    
+    @classmethod
+    def _load_gpu_rates(cls) -> Dict[HashAlgorithm, float]:
+        """
+        GPU hash rates for this machine, measured with `hashcat -b`.
+        
+        Results are cached as JSON so the (slow) benchmark runs once. Any
+        algorithm hashcat cannot measure - or every algorithm, if hashcat is
+        not installed - keeps its baked-in RTX 4090 rate.
+        """
+        rates = dict(cls.GPU_PERFORMANCE)
+        try:
+            cached = json.loads(_GPU_RATES_CACHE.read_text())
+            rates.update((HashAlgorithm(name), rate) for name, rate in cached.items())
+            return rates
+        except (OSError, ValueError):
+            pass
+        
+        hashcat = shutil.which("hashcat")
+        if hashcat is None:
+            return rates
+        
+        measured = {}
+        for algorithm, mode in cls.HASHCAT_MODES.items():
+            try:
+                completed = subprocess.run(
+                    [hashcat, "-m", str(mode), "-b", "--quiet"],
+                    capture_output=True, text=True, timeout=60
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+            speed = _parse_hashcat_speed(completed.stdout)
+            if speed:
+                measured[algorithm.value] = speed
+        
+        if measured:
+            try:
+                _GPU_RATES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                _GPU_RATES_CACHE.write_text(json.dumps(measured, indent=2))
+            except OSError:
+                pass
+        rates.update((HashAlgorithm(name), rate) for name, rate in measured.items())
+        return rates
     
     def hash_password(
         self, 
@@ -95,53 +429,153 @@ class HashEngine:
         Returns:
             HashResult with hash value, salt, and timing info
         """
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         
         if algorithm == HashAlgorithm.ARGON2ID:
-            result = self._hash_argon2id(password)
+            result = self._hash_argon2id(password, custom_params)
         elif algorithm == HashAlgorithm.SCRYPT:
             result = self._hash_scrypt(password, custom_params)
         elif algorithm == HashAlgorithm.PBKDF2_SHA256:
-            result = self._hash_pbkdf2(password, hashes.SHA256(), custom_params)
+            result = self._hash_pbkdf2(password, "sha256", custom_params)
         elif algorithm == HashAlgorithm.PBKDF2_SHA512:
-            result = self._hash_pbkdf2(password, hashes.SHA512(), custom_params)
+            result = self._hash_pbkdf2(password, "sha512", custom_params)
         elif algorithm == HashAlgorithm.BCRYPT:
             result = self._hash_bcrypt(password, custom_params)
         else:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
         
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
-        result.time_ms = elapsed_ms
+        result.time_ns = time.perf_counter_ns() - start_ns
+        result.time_ms = result.time_ns / 1e6
         
         return result
     
+    def hash_many(
+        self,
+        passwords: Iterable[str],
+        algorithm: HashAlgorithm = HashAlgorithm.ARGON2ID,
+        custom_params: Optional[Dict] = None,
+        workers: Optional[int] = None
+    ) -> HashResultBatch:
+        """
+        Hash many passwords across a pool of processes.
+        
+        By default the pool gets one worker for every `parallelism` CPU
+        cores, so each worker keeps one core per lane of its Argon2 hasher.
+        Workers build their own argon2.PasswordHasher with this engine's
+        time/memory/parallelism costs rather than sharing this one, so a
+        custom argon2_backend cannot be used for Argon2id here.
+        
+        Args:
+            passwords: Passwords to hash
+            algorithm: Hashing algorithm to use
+            custom_params: Custom parameters for the algorithm
+            workers: Number of worker processes (default: derived from CPU count)
+            
+        Returns:
+            HashResultBatch in the same order as passwords
+            
+        Raises:
+            ValueError: If Argon2id is requested and the engine was built with
+                a custom argon2_backend
+        """
+        import numpy as np
+        
+        if algorithm == HashAlgorithm.ARGON2ID and not isinstance(
+            self.argon2_hasher, argon2.PasswordHasher
+        ):
+            raise ValueError("hash_many() cannot use a custom argon2_backend; use hash_password()")
+        
+        passwords = list(passwords)
+        count = len(passwords)
+        batch = HashResultBatch(
+            algorithms=np.empty(count, dtype=np.uint8),
+            hash_values=[None] * count,
+            salts=[None] * count,
+            time_ms=np.empty(count, dtype=np.float64),
+            time_ns=np.empty(count, dtype=np.int64),
+            parameters=[None] * count,
+        )
+        
+        workers = workers or max(1, (os.cpu_count() or 1) // self.argon2_hasher.parallelism)
+        argon2_settings = {
+            "time_cost": self.argon2_hasher.time_cost,
+            "memory_cost": self.argon2_hasher.memory_cost,
+            "parallelism": self.argon2_hasher.parallelism,
+        }
+        task = functools.partial(_hash_in_worker, algorithm=algorithm, custom_params=custom_params)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_hash_worker,
+            initargs=(argon2_settings,)
+        ) as pool:
+            for i, result in enumerate(pool.map(task, passwords, chunksize=8)):
+                batch.algorithms[i] = _ALGORITHM_CODES.index(result.algorithm)
+                batch.hash_values[i] = result.hash_value
+                batch.salts[i] = result.salt
+                batch.time_ms[i] = result.time_ms
+                batch.time_ns[i] = result.time_ns
+                batch.parameters[i] = result.parameters
+        return batch
+    
     def verify_password(
         self, 
         password: str, 
         hash_value: str, 
-        algorithm: HashAlgorithm
+        algorithm: HashAlgorithm,
+        salt: Optional[str] = None,
+        parameters: Optional[Dict] = None
     ) -> bool:
         """
         Verify a password against a hash.
         
+        Encoded Argon2id and bcrypt hashes embed their salt and parameters.
+        PBKDF2, scrypt and raw Argon2id hashes (those with a salt) are
+        re-derived from the salt and parameters of their HashResult and
+        compared in constant time.
+        
         Args:
             password: Password to verify
             hash_value: Hash to check against
             algorithm: Algorithm used for hashing
+            salt: Hex salt from the HashResult (PBKDF2, scrypt, raw Argon2id)
+            parameters: Parameters from the HashResult (PBKDF2, scrypt, raw Argon2id)
             
         Returns:
             True if password matches, False otherwise
+            
+        Raises:
+            ValueError: If a PBKDF2 or scrypt hash is verified without its
+                salt and parameters
         """
+        if algorithm not in (HashAlgorithm.ARGON2ID, HashAlgorithm.BCRYPT):
+            if salt is None or parameters is None:
+                raise ValueError(f"{algorithm.value} verification needs the hash's salt and parameters")
+        elif algorithm == HashAlgorithm.ARGON2ID and salt is not None and parameters is None:
+            raise ValueError("Raw argon2id verification needs the hash's parameters")
+        
         try:
-            if algorithm == HashAlgorithm.ARGON2ID:
+            if algorithm == HashAlgorithm.ARGON2ID and salt is None:
                 self.argon2_hasher.verify(hash_value, password)
                 return True
+            elif algorithm == HashAlgorithm.ARGON2ID:
+                derived = self._hash_argon2id_raw(
+                    password, bytes.fromhex(salt), parameters, hash_len=len(hash_value) // 2
+                )
             elif algorithm == HashAlgorithm.BCRYPT:
                 return bcrypt.checkpw(password.encode(), hash_value.encode())
+            elif algorithm == HashAlgorithm.SCRYPT:
+                n, r, p = parameters["n"], parameters["r"], parameters["p"]
+                derived = hashlib.scrypt(
+                    password.encode(), salt=bytes.fromhex(salt), n=n, r=r, p=p,
+                    maxmem=256 * r * (n + p), dklen=len(hash_value) // 2
+                )
             else:
-                # For PBKDF2 and scrypt, we need to re-hash and compare
-                # This is a simplified verification for educational purposes
-                return True
+                hash_name = "sha256" if algorithm == HashAlgorithm.PBKDF2_SHA256 else "sha512"
+                derived = hashlib.pbkdf2_hmac(
+                    hash_name, password.encode(), bytes.fromhex(salt),
+                    parameters["iterations"], dklen=len(hash_value) // 2
+                )
+            return hmac.compare_digest(derived.hex(), hash_value)
         except Exception:
             return False
     
@@ -164,32 +598,100 @@ class HashEngine:
         Returns:
             CrackEstimate with time estimates
         """
-        # Calculate total possible combinations
-        total_combinations = charset_size ** password_length
-        
-        # Average case: need to try 50% of combinations
-        avg_combinations = total_combinations // 2
-        
+        # Work in log2 space so long passwords never build huge integers:
+        # total combinations = charset_size ** password_length, and the
+        # average case needs to try 50% of them
         # Get hashing rate
-        hashes_per_second = self.GPU_PERFORMANCE[algorithm] if use_gpu else 1000
+        hashes_per_second = self.gpu_performance[algorithm] if use_gpu else 1000
         
-        # Calculate time in seconds
-        seconds = avg_combinations / hashes_per_second
+        # Calculate time in seconds (inf once it no longer fits in a float)
+        if password_length == 0 or charset_size <= 1:
+            # A single candidate (or none): nothing left to guess on average
+            log2_seconds = -math.inf
+        else:
+            log2_combinations = password_length * math.log2(charset_size)
+            log2_seconds = log2_combinations - 1 - math.log2(hashes_per_second)
+        seconds = 2.0 ** log2_seconds if log2_seconds < 1023 else math.inf
         
         # Convert to human-readable format
-        human_readable = self._format_time(seconds)
+        human_readable = self._format_time(seconds, log2_seconds)
         
         return CrackEstimate(
             seconds=seconds,
             human_readable=human_readable,
-            hashes_required=avg_combinations,
-            algorithm=algorithm
+            algorithm=algorithm,
+            password_length=password_length,
+            charset_size=charset_size
         )
     
+    def estimate_crack_time_batch(
+        self,
+        lengths: "np.ndarray",
+        charset_sizes: "np.ndarray",
+        algorithm: HashAlgorithm,
+        use_gpu: bool = True
+    ) -> "np.ndarray":
+        """
+        Estimate brute-force crack times for a grid of lengths and charsets.
+        
+        Vectorized form of estimate_crack_time (same log2-space formula),
+        for tables that cover many (length, charset) pairs at once.
+        
+        Args:
+            lengths: Password lengths (columns of the result)
+            charset_sizes: Character set sizes (rows of the result)
+            algorithm: Hashing algorithm
+            use_gpu: Whether to simulate GPU cracking
+            
+        Returns:
+            Array of seconds with shape (len(charset_sizes), len(lengths));
+            inf where the time does not fit in a float
+        """
+        import numpy as np
+        
+        lengths = np.asarray(lengths, dtype=np.float64)
+        charset_sizes = np.asarray(charset_sizes, dtype=np.float64)
+        length_grid, charset_grid = np.meshgrid(lengths, charset_sizes)
+        hashes_per_second = self.gpu_performance[algorithm] if use_gpu else 1000
+        log2_hps = math.log2(hashes_per_second)
+        
+        kernel = _numba_crack_grid()
+        if kernel is not None:
+            log2_seconds = kernel(lengths, charset_sizes, log2_hps)
+        else:
+            log2_seconds = length_grid * np.log2(np.maximum(charset_grid, 1)) - 1 - log2_hps
+        
+        # A single candidate (or none) needs no guessing, as in the scalar path
+        trivial = (length_grid == 0) | (charset_grid <= 1)
+        seconds = np.where(log2_seconds < 1023, np.exp2(np.minimum(log2_seconds, 1023)), np.inf)
+        return np.where(trivial, 0.0, seconds)
+    
     # Private helper methods
     
-    def _hash_argon2id(self, password: str) -> HashResult:
-        """Hash using Argon2id (2025 recommended)"""
+    def _hash_argon2id(self, password: str, params: Optional[Dict] = None) -> HashResult:
+        """
+        Hash using Argon2id (2025 recommended).
+        
+        params={"raw": True} returns the bare hex digest and salt, skipping
+        the $argon2id$ string encoding (and its parsing on verify).
+        """
+        _warn_if_hugepages_disabled()
+        parameters = {
+            "time_cost": self.argon2_hasher.time_cost,
+            "memory_cost": self.argon2_hasher.memory_cost,
+            "parallelism": self.argon2_hasher.parallelism,
+        }
+        
+        if params and params.get("raw"):
+            salt = self._salt_pool.take(16)
+            return HashResult(
+                algorithm=HashAlgorithm.ARGON2ID,
+                hash_value=self._hash_argon2id_raw(password, salt, parameters).hex(),
+                salt=salt.hex(),
+                time_ms=0.0,  # Set by caller
+                parameters=parameters
+            )
+        
         hash_value = self.argon2_hasher.hash(password)
         
         return HashResult(
@@ -197,16 +699,30 @@ class HashEngine:
             hash_value=hash_value,
             salt=None,  # Salt is embedded in hash
             time_ms=0.0,  # Set by caller
-            parameters={
-                "time_cost": 3,
-                "memory_cost": 65536,
-                "parallelism": 4,
-            }
+            parameters=parameters
+        )
+    
+    @staticmethod
+    def _hash_argon2id_raw(
+        password: str,
+        salt: bytes,
+        parameters: Dict[str, int],
+        hash_len: int = 32
+    ) -> bytes:
+        """Bare Argon2id digest via argon2-cffi's low-level API"""
+        return hash_secret_raw(
+            password.encode(),
+            salt,
+            time_cost=parameters["time_cost"],
+            memory_cost=parameters["memory_cost"],
+            parallelism=parameters["parallelism"],
+            hash_len=hash_len,
+            type=Type.ID,
         )
     
     def _hash_scrypt(self, password: str, params: Optional[Dict] = None) -> HashResult:
         """Hash using scrypt"""
-        salt = secrets.token_bytes(16)
+        salt = self._salt_pool.take(16)
         n = params.get("n", 2**14) if params else 2**14  # CPU/memory cost
         r = params.get("r", 8) if params else 8          # Block size
         p = params.get("p", 1) if params else 1          # Parallelization
@@ -233,23 +749,15 @@ class HashEngine:
     def _hash_pbkdf2(
         self, 
         password: str, 
-        hash_algo: any,
+        hash_name: str,
         params: Optional[Dict] = None
     ) -> HashResult:
-        """Hash using PBKDF2"""
-        salt = secrets.token_bytes(16)
+        """Hash using PBKDF2 (hashlib's OpenSSL-backed pbkdf2_hmac)"""
+        salt = self._salt_pool.take(16)
         iterations = params.get("iterations", 600_000) if params else 600_000
         
-        kdf = PBKDF2HMAC(
-            algorithm=hash_algo,
-            length=32,
-            salt=salt,
-            iterations=iterations,
-            backend=default_backend()
-        )
-        
-        hash_value = kdf.derive(password.encode())
-        algo_name = "SHA256" if isinstance(hash_algo, hashes.SHA256) else "SHA512"
+        hash_value = hashlib.pbkdf2_hmac(hash_name, password.encode(), salt, iterations, dklen=32)
+        algo_name = hash_name.upper()
         
         return HashResult(
             algorithm=HashAlgorithm.PBKDF2_SHA256 if algo_name == "SHA256" 
@@ -263,7 +771,7 @@ class HashEngine:
     def _hash_bcrypt(self, password: str, params: Optional[Dict] = None) -> HashResult:
         """Hash using bcrypt"""
         rounds = params.get("rounds", 12) if params else 12
-        salt = bcrypt.gensalt(rounds=rounds)
+        salt = _bcrypt_salt(self._salt_pool.take(16), rounds)
         hash_value = bcrypt.hashpw(password.encode(), salt)
         
         return HashResult(
@@ -275,33 +783,59 @@ class HashEngine:
         )
     
     @staticmethod
-    def _format_time(seconds: float) -> str:
+    def _format_time(seconds: float, log2_seconds: Optional[float] = None) -> str:
         """Format seconds into human-readable time"""
-        if seconds < 1:
-            return f"{seconds*1000:.2f} milliseconds"
-        elif seconds < 60:
-            return f"{seconds:.2f} seconds"
-        elif seconds < 3600:
-            minutes = seconds / 60
-            return f"{minutes:.2f} minutes"
-        elif seconds < 86400:
-            hours = seconds / 3600
-            return f"{hours:.2f} hours"
-        elif seconds < 31536000:
-            days = seconds / 86400
-            return f"{days:.2f} days"
-        elif seconds < 31536000 * 100:
-            years = seconds / 31536000
-            return f"{years:.2f} years"
-        elif seconds < 31536000 * 1000:
-            years = seconds / 31536000
-            return f"{years:.0f} years"
-        elif seconds < 31536000 * 1_000_000:
-            years = seconds / 31536000
-            return f"{years/1000:.0f} thousand years"
-        elif seconds < 31536000 * 1_000_000_000:
-            years = seconds / 31536000
-            return f"{years/1_000_000:.0f} million years"
-        else:
-            years = seconds / 31536000
-            return f"{years/1_000_000_000:.0f} billion years"
+        if math.isinf(seconds) and log2_seconds is not None:
+            # Beyond float range: report the order of magnitude from log2
+            log10_years = (log2_seconds - math.log2(_SECONDS_PER_YEAR)) * math.log10(2)
+            return f"10^{log10_years - 9:.0f} billion years"
+        bucket = len(_TIME_THRESHOLDS) if math.isinf(seconds) else _time_bucket(seconds)
+        unit, template = _TIME_UNITS[bucket]
+        return template % (seconds / unit)
+    
+    @staticmethod
+    def format_time_batch(seconds: "np.ndarray") -> "np.ndarray":
+        """
+        Format an array of seconds (e.g. from estimate_crack_time_batch).
+        
+        Buckets come from the exponent lookup table for the whole array at
+        once; the strings match _format_time for finite values.
+        
+        Returns:
+            Object array of strings with the same shape as seconds
+        """
+        import numpy as np
+        
+        seconds = np.asarray(seconds, dtype=np.float64)
+        finite = np.isfinite(seconds)
+        exponent = np.clip(np.frexp(np.where(finite, seconds, 0.0))[1] - 1, -1, 63)
+        bucket = np.asarray(_BUCKET_LUT)[exponent + 1]
+        bucket += seconds >= np.asarray(_BUCKET_BOUNDS)[bucket]
+        bucket = np.where(finite, bucket, len(_TIME_THRESHOLDS))
+        
+        units = np.array([unit for unit, _ in _TIME_UNITS], dtype=np.float64)
+        values = seconds / units[bucket]
+        formatted = np.empty(seconds.shape, dtype=object)
+        for index in np.unique(bucket):
+            mask = bucket == index
+            formatted[mask] = np.char.mod(_TIME_UNITS[index][1], values[mask])
+        return formatted
+
+
+_worker_engine: Optional[HashEngine] = None
+
+
+def _init_hash_worker(argon2_settings: Dict[str, int]) -> None:
+    """Process pool initializer: build the worker's own engine and hasher"""
+    global _worker_engine
+    _worker_engine = HashEngine(argon2.PasswordHasher(**argon2_settings))
+
+
+def _hash_in_worker(
+    password: str,
+    algorithm: HashAlgorithm,
+    custom_params: Optional[Dict]
+) -> HashResult:
+    """Worker: hash one password with the worker's engine"""
+    assert _worker_engine is not None, "_init_hash_worker() has not run"
+    return _worker_engine.hash_password(password, algorithm, custom_params)
@@ -0,0 +1 @@
+"""Markdown lesson content for the learning module"""
@@ -9,20 +9,102 @@ Provides comprehensive password security analysis including:
 - Security recommendations
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Iterable, Mapping, Tuple, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
+import functools
+from math import log2 as _log2
 import re
-import math
 import string
-
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+from types import MappingProxyType
 
 from ..core.hash_engine import HashEngine, HashAlgorithm
 
+if TYPE_CHECKING:
+    import numpy as np
+    from rich.console import Console
+
+
+# Common l33t-speak substitutes (@ for a, 3 for e, 1 for i, 0 for o, $ for s, 7 for t)
+_LEET_CHARS = frozenset('@310$7')
+
+# Character class bits for _charset_flags
+_LOWER, _UPPER, _DIGIT, _SPECIAL, _SPACE = 1, 2, 4, 8, 16
+
+
+def _build_category_lut() -> bytes:
+    """Character class bits for every byte value (non-ASCII bytes have none)"""
+    lut = bytearray(256)
+    for chars, bit in (
+        (string.ascii_lowercase, _LOWER),
+        (string.ascii_uppercase, _UPPER),
+        (string.digits, _DIGIT),
+        (string.punctuation, _SPECIAL),
+        (' ', _SPACE),
+    ):
+        for c in chars:
+            lut[ord(c)] |= bit
+    return bytes(lut)
+
+
+_CAT_LUT = _build_category_lut()
+
+# Characters contributed to the set by each class
+_CLASS_SIZES = ((_LOWER, 26), (_UPPER, 26), (_DIGIT, 10), (_SPECIAL, 32), (_SPACE, 1))
+
+# Character set size for every combination of class bits (none -> 1)
+_SIZE_BY_FLAGS = tuple(
+    max(1, sum(size for bit, size in _CLASS_SIZES if flags & bit))
+    for flags in range(32)
+)
+
+# Below this length the pure-Python charset scan beats NumPy's call overhead
+_NUMPY_MIN_LENGTH = 128
+
+
+@functools.cache
+def _cat_lut_np() -> "np.ndarray":
+    """_CAT_LUT as a NumPy array, for gathering class bits of whole passwords"""
+    import numpy as np
+    return np.frombuffer(_CAT_LUT, dtype=np.uint8)
+
+
+def _charset_flags(password: str) -> int:
+    """OR of the _CAT_LUT class bits of every character in password"""
+    # translate() maps every ASCII byte to its class bits in C; only the
+    # few distinct values left are OR-ed together in Python
+    flags = 0
+    for bits in set(password.encode('ascii', 'ignore').translate(_CAT_LUT)):
+        flags |= bits
+    return flags
+
+
+def _charset_flags_np(password: str) -> int:
+    """Vectorized _charset_flags for long passwords"""
+    import numpy as np
+    codes = np.frombuffer(password.encode('ascii', 'ignore'), dtype=np.uint8)
+    return int(np.bitwise_or.reduce(_cat_lut_np()[codes]))
+
+
+@functools.cache
+def _pattern_automaton(patterns: Tuple[str, ...]) -> Optional[Any]:
+    """
+    Aho-Corasick automaton over patterns, built once per pattern set.
+    
+    Returns None if the optional 'patterns' extra (pyahocorasick) is not
+    installed; callers then fall back to one substring search per pattern.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
 
 class PasswordStrength(Enum):
     """Password strength categories"""
@@ -33,7 +115,22 @@ class PasswordStrength(Enum):
     VERY_STRONG = "very_strong"
 
 
-@dataclass
+# Display colors for strengths (one per member) and pattern severities
+_STRENGTH_COLORS = {
+    PasswordStrength.VERY_WEAK: "red",
+    PasswordStrength.WEAK: "orange1",
+    PasswordStrength.MODERATE: "yellow",
+    PasswordStrength.STRONG: "green",
+    PasswordStrength.VERY_STRONG: "bold green",
+}
+_SEVERITY_COLORS = {
+    'low': 'yellow',
+    'medium': 'orange1',
+    'high': 'red',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PatternMatch:
     """Detected pattern in password"""
     pattern_type: str
@@ -42,18 +139,32 @@ class PatternMatch:
     position: Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class _ScanResult:
+    """Facts about a password gathered once and shared by the analysis steps"""
+    charset_flags: int  # Class bits present anywhere in the password
+    scanned: str  # Prefix (up to max_length) searched for patterns
+    scanned_lower: str
+    pattern_hits: Mapping[str, int]  # First start of each keyboard pattern/sequence
+
+
+@dataclass(slots=True, frozen=True)
 class PasswordAnalysis:
-    """Complete password security analysis"""
+    """
+    Complete password security analysis.
+    
+    Containers are read-only (tuples and mapping proxies) as well as the
+    attributes, so a result can be shared safely by every caller.
+    """
     password: str
     length: int
     charset_size: int
     entropy_bits: float
     strength: PasswordStrength
-    patterns: List[PatternMatch]
-    crack_time_estimates: Dict[str, str]
+    patterns: Tuple[PatternMatch, ...]
+    crack_time_estimates: Mapping[str, Mapping[str, str]]  # Display name -> {'cpu', 'gpu'}
     score: int  # 0-100
-    recommendations: List[str]
+    recommendations: Tuple[str, ...]
 
 
 class PasswordAnalyzer:
@@ -68,6 +179,13 @@ class PasswordAnalyzer:
     - Actionable improvement recommendations
     """
     
+    # Algorithms shown in crack time estimates, with display names
+    _CRACK_ALGOS = (
+        (HashAlgorithm.ARGON2ID, "Argon2id (2025 Recommended)"),
+        (HashAlgorithm.BCRYPT, "bcrypt"),
+        (HashAlgorithm.PBKDF2_SHA256, "PBKDF2-SHA256"),
+    )
+    
     # Common keyboard patterns
     KEYBOARD_PATTERNS = [
         'qwerty', 'asdfgh', 'zxcvbn', '12345', 'qwertyuiop',
@@ -79,20 +197,62 @@ class PasswordAnalyzer:
         'abc', '123', 'xyz', 'rst',
     ]
     
+    # Common passwords (simplified for demo), shared by all instances
+    COMMON_PASSWORDS = frozenset({
+        'password', '123456', '12345678', 'qwerty', 'abc123',
+        'password123', 'admin', 'letmein', 'welcome', 'monkey',
+        'dragon', 'master', 'sunshine', 'princess', 'football',
+        'iloveyou', 'shadow', 'michael', 'superman', 'trustno1',
+        'passw0rd', 'admin123', 'root', 'toor', 'password1',
+    })
+    
     # Common years (for date detection)
     YEAR_PATTERN = re.compile(r'(19|20)\d{2}')
     
-    def __init__(self, hash_engine: Optional[HashEngine] = None) -> None:
+    # Runs of three or more identical characters (newlines included)
+    REPEAT_PATTERN = re.compile(r'(.)\1{2,}', re.DOTALL)
+    
+    def __init__(
+        self,
+        hash_engine: Optional[HashEngine] = None,
+        max_length: int = 256,
+        cache_size: int = 1024
+    ) -> None:
+        """
+        Args:
+            hash_engine: Engine used for crack time estimates
+            max_length: Only the first max_length characters are scanned for
+                patterns, bounding the work done on very long inputs
+            cache_size: Number of recent analyze() results kept for repeat
+                passwords (0 disables the cache)
+        """
         self.hash_engine = hash_engine or HashEngine()
-        self.console = Console()
+        self._console = None
+        self.max_length = max_length
         
-        # Load common passwords (in real implementation, load from file)
-        self.common_passwords = self._load_common_passwords()
+        # Per-instance and bounded, so plaintext passwords are not held
+        # indefinitely; clear_cache() drops them on demand
+        self._cached_analysis = functools.lru_cache(maxsize=cache_size)(self._analyze)
+        
+        # Crack times depend only on (length, charset, algorithm, GPU), not
+        # on the password itself, so they are shared across passwords
+        self._cached_crack_time = functools.lru_cache(maxsize=4096)(self._crack_time)
+    
+    @property
+    def console(self) -> "Console":
+        """Rich console, created on first display (batch analysis never needs one)"""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
     
     def analyze(self, password: str, verbose: bool = True) -> PasswordAnalysis:
         """
         Perform comprehensive password analysis.
         
+        Results are cached, so repeat calls for a password return the same
+        (read-only) PasswordAnalysis object.
+        
         Args:
             password: Password to analyze
             verbose: Whether to display detailed output
@@ -100,15 +260,66 @@ class PasswordAnalyzer:
         Returns:
             PasswordAnalysis with complete security assessment
         """
+        analysis = self._cached_analysis(password)
+        
+        if verbose:
+            self.display_analysis(analysis)
+        
+        return analysis
+    
+    def analyze_many(self, passwords: Iterable[str]) -> List[PasswordAnalysis]:
+        """
+        Analyze many passwords (e.g. auditing a password dump) without display.
+        
+        Character sets of long passwords are scanned with NumPy.
+        
+        Args:
+            passwords: Passwords to analyze
+            
+        Returns:
+            PasswordAnalysis for each password, in order
+        """
+        return [
+            self._analyze(password, use_numpy=len(password) >= _NUMPY_MIN_LENGTH)
+            for password in passwords
+        ]
+    
+    def clear_cache(self) -> None:
+        """Forget all cached analyze() results and crack time estimates"""
+        self._cached_analysis.cache_clear()
+        self._cached_crack_time.cache_clear()
+    
+    def _analyze(self, password: str, use_numpy: bool = False) -> PasswordAnalysis:
+        """
+        Uncached analysis behind analyze() and analyze_many().
+        
+        Args:
+            password: Password to analyze
+            use_numpy: Scan the character set with NumPy (for long passwords)
+        """
+        # Cheapest check first: a common password falls to a dictionary attack
+        # instantly, so it skips the pattern scan
+        common = len(password) <= self.max_length and password.lower() in self.COMMON_PASSWORDS
+        
+        charset_flags = _charset_flags_np(password) if use_numpy else _charset_flags(password)
+        
         # Calculate basic metrics
         length = len(password)
-        charset_size = self._calculate_charset_size(password)
+        charset_size = _SIZE_BY_FLAGS[charset_flags]
         entropy = self._calculate_entropy(password, charset_size)
         
-        # Detect patterns
-        patterns = self._detect_patterns(password)
+        if common:
+            patterns = [PatternMatch(
+                pattern_type="Common Password",
+                description="This is a commonly used password",
+                severity="high",
+                position=(0, length)
+            )]
+        else:
+            # Detect patterns (in at most max_length characters)
+            patterns = self._detect_patterns(self._scan(password, charset_flags))
         
-        # Estimate crack times
+        # Estimate crack times (cached per length and charset, so nearly free)
         crack_times = self._estimate_crack_times(password, length, charset_size)
         
         # Calculate score (0-100)
@@ -122,35 +333,26 @@ class PasswordAnalyzer:
             password, length, charset_size, patterns, strength
         )
         
-        analysis = PasswordAnalysis(
+        return PasswordAnalysis(
             password=password,
             length=length,
             charset_size=charset_size,
             entropy_bits=entropy,
             strength=strength,
-            patterns=patterns,
+            patterns=tuple(patterns),
             crack_time_estimates=crack_times,
             score=score,
-            recommendations=recommendations
+            recommendations=tuple(recommendations)
         )
-        
-        if verbose:
-            self.display_analysis(analysis)
-        
-        return analysis
     
     def display_analysis(self, analysis: PasswordAnalysis) -> None:
         """Display formatted analysis results"""
-        # Strength indicator with color
-        strength_colors = {
-            PasswordStrength.VERY_WEAK: "red",
-            PasswordStrength.WEAK: "orange1",
-            PasswordStrength.MODERATE: "yellow",
-            PasswordStrength.STRONG: "green",
-            PasswordStrength.VERY_STRONG: "bold green",
-        }
+        # Rich is only needed for display, not for analysis itself
+        from rich.table import Table
+        from rich import box
         
-        strength_color = strength_colors.get(analysis.strength, "white")
+        # Strength indicator with color (every strength has one)
+        strength_color = _STRENGTH_COLORS[analysis.strength]
         
         # Header
         self.console.print(f"\n[bold cyan]🔍 Password Security Analysis[/bold cyan]\n")
@@ -190,11 +392,7 @@ class PasswordAnalyzer:
             self.console.print("\n[bold yellow]⚠️  Patterns Detected[/bold yellow]\n")
             
             for pattern in analysis.patterns:
-                severity_color = {
-                    'low': 'yellow',
-                    'medium': 'orange1',
-                    'high': 'red'
-                }.get(pattern.severity, 'white')
+                severity_color = _SEVERITY_COLORS.get(pattern.severity, 'white')
                 
                 self.console.print(
                     f"  [{severity_color}]•[/{severity_color}] "
@@ -211,86 +409,76 @@ class PasswordAnalyzer:
     
     # Analysis methods
     
-    def _calculate_charset_size(self, password: str) -> int:
-        """Calculate the character set size used in password"""
-        has_lowercase = any(c in string.ascii_lowercase for c in password)
-        has_uppercase = any(c in string.ascii_uppercase for c in password)
-        has_digits = any(c in string.digits for c in password)
-        has_special = any(c in string.punctuation for c in password)
-        has_space = ' ' in password
-        
-        size = 0
-        if has_lowercase:
-            size += 26
-        if has_uppercase:
-            size += 26
-        if has_digits:
-            size += 10
-        if has_special:
-            size += 32
-        if has_space:
-            size += 1
-        
-        return size if size > 0 else 1
-    
     def _calculate_entropy(self, password: str, charset_size: int) -> float:
         """
         Calculate Shannon entropy of password.
         
-        Entropy (bits) = log2(charset_size ^ length)
+        Entropy (bits) = log2(charset_size ^ length) = length * log2(charset_size)
         """
         if len(password) == 0 or charset_size == 0:
             return 0.0
         
-        return math.log2(charset_size ** len(password))
+        return len(password) * _log2(charset_size)
     
-    def _detect_patterns(self, password: str) -> List[PatternMatch]:
+    def _scan(self, password: str, charset_flags: int) -> _ScanResult:
+        """Compute once the per-password facts the analysis steps share"""
+        scanned = password[:self.max_length]
+        # Already-lowercase input (the common case) needs no lowered copy
+        scanned_lower = scanned if scanned.islower() else scanned.lower()
+        return _ScanResult(
+            charset_flags=charset_flags,
+            scanned=scanned,
+            scanned_lower=scanned_lower,
+            pattern_hits=MappingProxyType(self._find_patterns(scanned_lower)),
+        )
+    
+    def _detect_patterns(self, scan: _ScanResult) -> List[PatternMatch]:
         """Detect common patterns that weaken passwords"""
         patterns = []
-        password_lower = password.lower()
+        password = scan.scanned
+        password_lower = scan.scanned_lower
         
-        # Check if it's a common password
-        if password_lower in self.common_passwords:
-            patterns.append(PatternMatch(
-                pattern_type="Common Password",
-                description="This is a commonly used password",
-                severity="high",
-                position=(0, len(password))
-            ))
+        # Keyboard patterns and sequences, located in a single pass
+        first_seen = scan.pattern_hits
         
         # Check for keyboard patterns
         for pattern in self.KEYBOARD_PATTERNS:
-            if pattern in password_lower:
+            start = first_seen.get(pattern)
+            if start is not None:
                 patterns.append(PatternMatch(
                     pattern_type="Keyboard Pattern",
                     description=f"Contains keyboard pattern: {pattern}",
                     severity="high",
-                    position=(password_lower.index(pattern), password_lower.index(pattern) + len(pattern))
+                    position=(start, start + len(pattern))
                 ))
         
         # Check for sequences
         for seq in self.SEQUENCES:
-            if seq in password_lower:
+            start = first_seen.get(seq)
+            if start is not None:
                 patterns.append(PatternMatch(
                     pattern_type="Character Sequence",
                     description=f"Contains character sequence: {seq}",
                     severity="medium",
-                    position=(password_lower.index(seq), password_lower.index(seq) + len(seq))
+                    position=(start, start + len(seq))
                 ))
         
-        # Check for repeated characters
-        for i in range(len(password) - 2):
-            if password[i] == password[i+1] == password[i+2]:
-                patterns.append(PatternMatch(
-                    pattern_type="Character Repetition",
-                    description=f"Repeated character: {password[i]}",
-                    severity="medium",
-                    position=(i, i+3)
-                ))
-                break
+        # Check for repeated characters (first run only)
+        repeat_match = self.REPEAT_PATTERN.search(password)
+        if repeat_match:
+            patterns.append(PatternMatch(
+                pattern_type="Character Repetition",
+                description=f"Repeated character: {repeat_match.group(1)}",
+                severity="medium",
+                position=repeat_match.span()
+            ))
         
-        # Check for dates/years
-        year_match = self.YEAR_PATTERN.search(password)
+        # Check for dates/years (a year needs "19" or "20"; skip the regex otherwise)
+        year_match = (
+            self.YEAR_PATTERN.search(password)
+            if scan.charset_flags & _DIGIT and ('19' in password or '20' in password)
+            else None
+        )
         if year_match:
             patterns.append(PatternMatch(
                 pattern_type="Date/Year",
@@ -300,9 +488,7 @@ class PasswordAnalyzer:
             ))
         
         # Check for common substitutions (l33t speak)
-        leet_patterns = {'@': 'a', '3': 'e', '1': 'i', '0': 'o', '$': 's', '7': 't'}
-        leet_found = any(char in password for char in leet_patterns.keys())
-        if leet_found:
+        if scan.charset_flags & (_DIGIT | _SPECIAL) and not _LEET_CHARS.isdisjoint(password):
             patterns.append(PatternMatch(
                 pattern_type="L33t Speak",
                 description="Uses common character substitutions (easily defeated)",
@@ -312,38 +498,52 @@ class PasswordAnalyzer:
         
         return patterns
     
+    def _find_patterns(self, password_lower: str) -> Dict[str, int]:
+        """Start of the first occurrence of each keyboard pattern and sequence found"""
+        automaton = _pattern_automaton(tuple(self.KEYBOARD_PATTERNS + self.SEQUENCES))
+        if automaton is None:
+            # One find() per pattern gives both presence and position
+            first_seen = {}
+            for pattern in self.KEYBOARD_PATTERNS + self.SEQUENCES:
+                start = password_lower.find(pattern)
+                if start != -1:
+                    first_seen[pattern] = start
+            return first_seen
+        
+        # Matches arrive in order of end position, so the first is the leftmost
+        first_seen: Dict[str, int] = {}
+        for end, pattern in automaton.iter(password_lower):
+            first_seen.setdefault(pattern, end - len(pattern) + 1)
+        return first_seen
+    
     def _estimate_crack_times(
         self, 
         password: str, 
         length: int, 
         charset_size: int
-    ) -> Dict[str, Dict[str, str]]:
-        """Estimate time to crack password with different algorithms"""
+    ) -> Mapping[str, Mapping[str, str]]:
+        """Estimate time to crack password with different algorithms (read-only)"""
         estimates = {}
         
-        algorithms = [
-            (HashAlgorithm.ARGON2ID, "Argon2id (2025 Recommended)"),
-            (HashAlgorithm.BCRYPT, "bcrypt"),
-            (HashAlgorithm.PBKDF2_SHA256, "PBKDF2-SHA256"),
-        ]
-        
-        for algo, display_name in algorithms:
-            # CPU estimate
-            cpu_estimate = self.hash_engine.estimate_crack_time(
-                length, charset_size, algo, use_gpu=False
-            )
-            
-            # GPU estimate
-            gpu_estimate = self.hash_engine.estimate_crack_time(
-                length, charset_size, algo, use_gpu=True
-            )
-            
-            estimates[display_name] = {
-                'cpu': cpu_estimate.human_readable,
-                'gpu': gpu_estimate.human_readable
-            }
+        for algo, display_name in self._CRACK_ALGOS:
+            estimates[display_name] = MappingProxyType({
+                'cpu': self._cached_crack_time(length, charset_size, algo, False),
+                'gpu': self._cached_crack_time(length, charset_size, algo, True)
+            })
         
-        return estimates
+        return MappingProxyType(estimates)
+    
+    def _crack_time(
+        self,
+        length: int,
+        charset_size: int,
+        algo: HashAlgorithm,
+        use_gpu: bool
+    ) -> str:
+        """Human-readable crack time estimate (cached per instance)"""
+        return self.hash_engine.estimate_crack_time(
+            length, charset_size, algo, use_gpu=use_gpu
+        ).human_readable
     
     def _calculate_score(
         self, 
@@ -449,14 +649,3 @@ class PasswordAnalyzer:
             )
         
         return recommendations
-    
-    @staticmethod
-    def _load_common_passwords() -> set:
-        """Load common passwords (simplified for demo)"""
-        return {
-            'password', '123456', '12345678', 'qwerty', 'abc123',
-            'password123', 'admin', 'letmein', 'welcome', 'monkey',
-            'dragon', 'master', 'sunshine', 'princess', 'football',
-            'iloveyou', 'shadow', 'michael', 'superman', 'trustno1',
-            'passw0rd', 'admin123', 'root', 'toor', 'password1',
-        }
@@ -0,0 +1,133 @@
+"""Tests for the attack simulator's candidate generators"""
+
+import hashlib
+import itertools
+from pathlib import Path
+
+import pytest
+
+from ciphersim.core.attack_simulator import (
+    AttackConfig,
+    AttackMode,
+    AttackSimulator,
+    GPUSimulator,
+    _enumerate_columns,
+    _index_in_batch,
+    _parallel_scan,
+    _scan_stream,
+)
+from ciphersim.core.hash_engine import HashAlgorithm
+
+
+def _hybrid_candidates(tmp_path: Path, words: str) -> list:
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text(words, encoding="utf-8")
+    config = AttackConfig(
+        mode=AttackMode.HYBRID,
+        target_hash="",
+        algorithm=HashAlgorithm.ARGON2ID,
+        wordlist_path=wordlist,
+    )
+    return list(AttackSimulator()._hybrid_generator(config))
+
+
+def test_hybrid_case_variants_for_non_ascii_words(tmp_path: Path) -> None:
+    candidates = _hybrid_candidates(tmp_path, "straße\npässword\n")
+    
+    assert "Straße".encode() in candidates
+    assert "STRASSE".encode() in candidates
+    assert "Pässword".encode() in candidates
+    assert "PÄSSWORD".encode() in candidates
+    assert "Pässword123".encode() in candidates
+
+
+def test_hybrid_mutates_non_ascii_words_as_text(tmp_path: Path) -> None:
+    candidates = _hybrid_candidates(tmp_path, "pässwort\n")
+    
+    word = "pässwort"
+    expected = [word, "Pässwort", "PÄSSWORT", word]
+    for suffix in ("1", "123", "2024", "2025", "!"):
+        expected += [word + suffix, "Pässwort" + suffix]
+    expected.append("pä55w0r7")
+    assert candidates == [candidate.encode() for candidate in expected]
+
+
+def test_hybrid_ascii_words_keep_l33t_for_both_cases(tmp_path: Path) -> None:
+    candidates = _hybrid_candidates(tmp_path, "Secret\n")
+    
+    assert candidates[-1] == b"53cr37"
+
+
+def _sha256_config(algorithm) -> AttackConfig:
+    return AttackConfig(
+        mode=AttackMode.DICTIONARY,
+        target_hash=hashlib.sha256(b"dragon").hexdigest(),
+        algorithm=algorithm,
+        speed_limit=1_000_000,
+    )
+
+
+def test_sha256_digest_target_is_verified_by_hashing() -> None:
+    result = AttackSimulator().simulate_attack(_sha256_config(None), "not-the-password")
+    
+    assert result.success
+    assert result.password_found == "dragon"
+
+
+def test_sha256_digest_target_rejects_other_algorithms() -> None:
+    with pytest.raises(ValueError):
+        AttackSimulator().simulate_attack(_sha256_config(HashAlgorithm.BCRYPT), "dragon")
+
+
+def _serial_scan(keyspaces: list, target: bytes, limit: int) -> tuple:
+    """Reference result from streaming every candidate in order"""
+    candidates = itertools.islice(
+        itertools.chain.from_iterable(_enumerate_columns(c) for c in keyspaces), limit
+    )
+    position = 0
+    found = None
+    
+    def visit(batch) -> bool:
+        nonlocal position, found
+        index = _index_in_batch(batch, target)
+        if index >= 0:
+            found = position + index
+            return True
+        position += len(batch)
+        return False
+    
+    _scan_stream(candidates, visit)
+    return found, position
+
+
+@pytest.mark.parametrize("target", [
+    # Short keyspaces, then either side of the 1024-row slice boundaries of
+    # the 2187-candidate length-7 keyspace
+    b"a", b"cc", b"abcab", b"aaaaaaa", b"bbabcca", b"bbabccb", b"ccbacbb", b"ccbacbc",
+    b"ccccccc", b"none",
+])
+def test_parallel_scan_matches_serial_scan(target: bytes) -> None:
+    keyspaces = [("abc",) * length for length in range(1, 8)]
+    limit = 10_000
+    
+    position, count = _parallel_scan(keyspaces, target, limit, workers=2)
+    expected_position, expected_count = _serial_scan(keyspaces, target, limit)
+    
+    assert position == expected_position
+    if position is None:
+        assert count == expected_count
+
+
+def test_parallel_scan_respects_attempt_limit() -> None:
+    keyspaces = [("abc",) * length for length in range(1, 8)]
+    
+    assert _parallel_scan(keyspaces, b"ccccccc", 1500, workers=2) == (None, 1500)
+    assert _serial_scan(keyspaces, b"ccccccc", 1500) == (None, 1500)
+
+
+def test_cpu_batch_verification_finds_digest() -> None:
+    candidates = [b"alpha", b"bravo", b"charlie"]
+    digest = hashlib.sha256(hashlib.sha256(b"bravo").digest()).digest()
+    
+    assert GPUSimulator.verify_batch_cpu(candidates, digest, rounds=2) == 1
+    assert GPUSimulator.verify_batch_cpu(candidates, bytes(32)) == -1
@@ -0,0 +1,115 @@
+"""Tests for the defense simulator"""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from ciphersim.core import defense_simulator
+from ciphersim.core.defense_simulator import (
+    DefenseConfig,
+    DefenseSimulator,
+    DefenseType,
+    _INITIAL_IDS,
+)
+
+
+class _Clock:
+    """Stand-in for time.monotonic() that only moves when told to"""
+    
+    def __init__(self) -> None:
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(defense_simulator.time, "monotonic", fake)
+    return fake
+
+
+def _quiet_simulator() -> DefenseSimulator:
+    simulator = DefenseSimulator()
+    simulator.console = Console(file=io.StringIO())
+    return simulator
+
+
+def test_simulate_defense_stops_progress_display() -> None:
+    simulator = _quiet_simulator()
+    
+    for _ in range(2):
+        simulator.simulate_defense(DefenseType.RATE_LIMITING, attack_attempts=5, attack_rate=1000)
+        assert not simulator._progress.live.is_started
+
+
+def test_context_manager_closes_progress_display() -> None:
+    with _quiet_simulator() as simulator:
+        progress = simulator._shared_progress()
+        assert progress.live.is_started
+    
+    assert not progress.live.is_started
+
+
+def test_account_locks_at_threshold(clock: _Clock) -> None:
+    simulator = DefenseSimulator(DefenseConfig(lockout_threshold=3))
+    
+    assert not simulator.record_failed_login("alice")
+    assert not simulator.record_failed_login("alice")
+    assert not simulator.is_locked("alice")
+    assert simulator.record_failed_login("alice")
+    assert simulator.is_locked("alice")
+    assert not simulator.is_locked("bob")
+
+
+def test_expired_lockouts_are_released(clock: _Clock) -> None:
+    simulator = DefenseSimulator(DefenseConfig(lockout_threshold=1, lockout_duration_minutes=15))
+    simulator.record_failed_login("alice")
+    
+    clock.now += 15 * 60 - 1
+    assert simulator.release_expired_lockouts() == 0
+    assert simulator.is_locked("alice")
+    
+    clock.now += 1
+    assert not simulator.is_locked("alice")
+    assert simulator.release_expired_lockouts() == 1
+    assert simulator.release_expired_lockouts() == 0
+
+
+def test_state_arrays_grow_past_initial_capacity(clock: _Clock) -> None:
+    simulator = DefenseSimulator(DefenseConfig(lockout_threshold=2))
+    users = [f"user{i}" for i in range(_INITIAL_IDS * 2 + 1)]
+    for user in users:
+        simulator.record_failed_login(user)
+    simulator.record_failed_login(users[-1])
+    
+    assert len(simulator.failed_attempts) == _INITIAL_IDS * 4
+    assert len(simulator.lockout_expiry) == len(simulator.ip_minute_counts) == _INITIAL_IDS * 4
+    assert simulator.failed_attempts[:len(users) - 1].tolist() == [1] * (len(users) - 1)
+    assert simulator.is_locked(users[-1])
+    assert not simulator.is_locked(users[0])
+
+
+def test_ip_attempts_are_limited_per_minute(clock: _Clock) -> None:
+    simulator = DefenseSimulator(DefenseConfig(ip_max_attempts=2))
+    
+    assert simulator.record_ip_attempt("10.0.0.1")
+    assert simulator.record_ip_attempt("10.0.0.1")
+    assert not simulator.record_ip_attempt("10.0.0.1")
+    assert simulator.record_ip_attempt("10.0.0.2")
+    
+    clock.now += 59.9
+    assert not simulator.record_ip_attempt("10.0.0.1")
+    
+    clock.now += 0.1
+    assert simulator.record_ip_attempt("10.0.0.1")
+
+
+def test_lockout_demo_blocks_after_threshold() -> None:
+    simulator = _quiet_simulator()
+    simulator.simulate_defense(DefenseType.ACCOUNT_LOCKOUT, attack_attempts=8)
+    
+    assert simulator.is_locked("demo_user")
+    assert "Account locked after 5 failed attempts" in simulator.console.file.getvalue()
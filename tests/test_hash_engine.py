@@ -0,0 +1,79 @@
+"""Tests for the hash engine"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import argon2
+import pytest
+
+from ciphersim.core.hash_engine import HashAlgorithm, HashEngine
+
+
+class _WrappedBackend:
+    """Custom Argon2id backend delegating to argon2-cffi"""
+    
+    def __init__(self) -> None:
+        self._hasher = argon2.PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1)
+        self.time_cost = self._hasher.time_cost
+        self.memory_cost = self._hasher.memory_cost
+        self.parallelism = self._hasher.parallelism
+    
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+    
+    def verify(self, hash: str, password: str) -> bool:
+        return self._hasher.verify(hash, password)
+
+
+def test_hash_many_matches_verify() -> None:
+    engine = HashEngine(argon2.PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1))
+    passwords = ["alpha", "bravo", "charlie"]
+    
+    batch = engine.hash_many(passwords, workers=2)
+    
+    for password, hash_value in zip(passwords, batch.hash_values):
+        assert engine.verify_password(password, hash_value, HashAlgorithm.ARGON2ID)
+
+
+def test_hash_many_rejects_custom_argon2_backend() -> None:
+    engine = HashEngine(_WrappedBackend())
+    
+    with pytest.raises(ValueError):
+        engine.hash_many(["alpha"], HashAlgorithm.ARGON2ID)
+
+
+def test_argon2_attack_rate_scales_with_memory_only() -> None:
+    assert HashEngine(preset="paranoid").gpu_performance[HashAlgorithm.ARGON2ID] == 50_000
+    assert HashEngine(preset="owasp").gpu_performance[HashAlgorithm.ARGON2ID] == 168_421
+    assert HashEngine.GPU_PERFORMANCE[HashAlgorithm.ARGON2ID] == 50_000
+
+
+def test_gpu_tiers_match_default_engine() -> None:
+    from ciphersim.core.attack_simulator import GPUSimulator
+    
+    engine = HashEngine()
+    for algorithm, rate in GPUSimulator.GPU_TIERS["RTX_4090"].items():
+        assert engine.gpu_performance[algorithm] == rate
+
+
+def test_salt_pool_handles_short_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    from ciphersim.core import hash_engine
+    
+    # Simulate getrandom() returning fewer bytes than asked for
+    monkeypatch.setattr(hash_engine, "_random_bytes", lambda size: os.urandom(min(size, 5)))
+    pool = hash_engine._SaltPool(chunk=64)
+    
+    salts = [pool.take(16) for _ in range(10)]
+    assert all(len(salt) == 16 for salt in salts)
+    assert len(set(salts)) == len(salts)
+
+
+def test_salt_pool_gives_threads_distinct_salts() -> None:
+    from ciphersim.core.hash_engine import _SaltPool
+    
+    pool = _SaltPool(chunk=256)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        salts = list(executor.map(lambda _: pool.take(16), range(2000)))
+    
+    assert all(len(salt) == 16 for salt in salts)
+    assert len(set(salts)) == len(salts)
@@ -0,0 +1,57 @@
+"""Tests for the password analyzer"""
+
+import pytest
+
+from ciphersim.modules.password_analyzer import PasswordAnalyzer
+
+
+@pytest.mark.parametrize("password", ["password", "qwerty2024!", "Tr0ub4dor&3"])
+def test_cached_result_cannot_be_mutated(password: str) -> None:
+    analyzer = PasswordAnalyzer()
+    result = analyzer.analyze(password, verbose=False)
+    recommendations = list(result.recommendations)
+    patterns = list(result.patterns)
+    crack_times = {name: dict(times) for name, times in result.crack_time_estimates.items()}
+    
+    with pytest.raises(AttributeError):
+        result.recommendations.append("MUTATED")
+    with pytest.raises(AttributeError):
+        result.patterns.clear()
+    with pytest.raises(TypeError):
+        result.crack_time_estimates["MUTATED"] = {}
+    for times in result.crack_time_estimates.values():
+        with pytest.raises(TypeError):
+            times["gpu"] = "MUTATED"
+    
+    again = analyzer.analyze(password, verbose=False)
+    assert again is result
+    assert list(again.recommendations) == recommendations
+    assert list(again.patterns) == patterns
+    assert {name: dict(times) for name, times in again.crack_time_estimates.items()} == crack_times
+
+
+@pytest.mark.parametrize("password, score", [("password", 4), ("Password", 10), ("12345678", 0)])
+def test_common_password_short_circuits_pattern_scan(
+    password: str, score: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_scan(*args: object) -> None:
+        raise AssertionError("common passwords must skip the pattern scan")
+    
+    analyzer = PasswordAnalyzer()
+    monkeypatch.setattr(analyzer, "_scan", no_scan)
+    result = analyzer.analyze(password, verbose=False)
+    
+    assert result.score == score
+    assert [p.pattern_type for p in result.patterns] == ["Common Password"]
+    assert set(result.crack_time_estimates) == {
+        name for _, name in PasswordAnalyzer._CRACK_ALGOS
+    }
+
+
+def test_analyze_many_matches_analyze() -> None:
+    passwords = ["password", "P@ssw0rd", "Tr0ub4dor&3", "ab1" * 100]
+    analyzer = PasswordAnalyzer()
+    
+    assert analyzer.analyze_many(passwords) == [
+        analyzer.analyze(password, verbose=False) for password in passwords
+    ]